@@ -2,24 +2,40 @@
 Configuration settings for News Terminal application.
 """
 import os
-from dataclasses import dataclass
-from typing import Optional, List
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, List, Pattern
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (once, on first use)
+_ensure_dotenv_loaded = lru_cache(maxsize=1)(load_dotenv)
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=None)
+def _cached_news_key() -> Optional[str]:
+    """Read the News API key from the environment."""
+    _ensure_dotenv_loaded()
+    return os.environ.get("NEWS_API_KEY")
+
+
+@lru_cache(maxsize=None)
+def _cached_alpha_vantage_key() -> Optional[str]:
+    """Read the Alpha Vantage key from the environment."""
+    _ensure_dotenv_loaded()
+    return os.environ.get("ALPHA_VANTAGE_KEY")
+
+
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """Configuration for API endpoints."""
-    news_api_key: Optional[str] = os.getenv("NEWS_API_KEY")  # Loaded from .env file
-    alpha_vantage_key: Optional[str] = os.getenv("ALPHA_VANTAGE_KEY")  # For financial news
+    news_api_key: Optional[str] = field(default_factory=_cached_news_key)  # Loaded from .env file
+    alpha_vantage_key: Optional[str] = field(default_factory=_cached_alpha_vantage_key)  # For financial news
     rate_limit_requests_per_minute: int = 60
     timeout_seconds: int = 10
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TerminalConfig:
     """Terminal display configuration."""
     refresh_interval: float = 0.1  # REAL-TIME: 100ms refresh for trading
@@ -34,7 +50,7 @@ class TerminalConfig:
     show_market_hours: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewsConfig:
     """News fetching configuration."""
     max_articles_per_source: int = 20  # More articles for real-time trading
@@ -44,6 +60,7 @@ class NewsConfig:
     retry_delay_seconds: float = 0.2  # Minimal retry delay
     real_time_sources: Optional[List[str]] = None  # Priority real-time sources
     trading_keywords: Optional[List[str]] = None
+    _keyword_pattern: Optional[Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.trading_keywords is None:
@@ -58,9 +75,20 @@ class NewsConfig:
                 'beat estimates', 'miss estimates', 'raised guidance', 'lowered guidance',
                 'upgrade', 'downgrade', 'price target', 'analyst', 'rating'
             ])
+        
+        # Compile the keyword set once into a single alternation so matching
+        # is one C-level scan per text instead of one substring test per keyword
+        keywords = sorted({k.lower() for k in self.trading_keywords}, key=len, reverse=True)
+        object.__setattr__(self, '_keyword_pattern', re.compile('|'.join(map(re.escape, keywords))))
+    
+    def matches(self, text: str) -> List[str]:
+        """Return the trading keywords found in text."""
+        if not self.trading_keywords:
+            return []
+        return self._keyword_pattern.findall(text.lower())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Main application configuration."""
     api: APIConfig
@@ -68,12 +96,22 @@ class AppConfig:
     news: NewsConfig
 
 
-# Default configuration instance
-DEFAULT_CONFIG = AppConfig(
-    api=APIConfig(),
-    terminal=TerminalConfig(),
-    news=NewsConfig()
-)
+# Default configuration instance, built on first access
+_default_config: Optional[AppConfig] = None
+
+
+def __getattr__(name: str):
+    """Lazily construct module-level defaults (PEP 562)."""
+    global _default_config
+    if name == 'DEFAULT_CONFIG':
+        if _default_config is None:
+            _default_config = AppConfig(
+                api=APIConfig(),
+                terminal=TerminalConfig(),
+                news=NewsConfig()
+            )
+        return _default_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # API endpoints
 API_ENDPOINTS = {
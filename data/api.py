@@ -1,18 +1,117 @@
 """
 API handlers for fetching news from various sources.
 """
+import asyncio
+import atexit
+import heapq
+import logging
+import sys
+import threading
 import time
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Generator, List, Optional, Dict, Any
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Mapping, Optional, Dict, Any, Protocol, Tuple
 
+import aiohttp
 import requests
 from dateutil import parser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson  # Optional: faster JSON decoding
+except ImportError:
+    orjson = None
 
-@dataclass(frozen=True)
+try:
+    import msgspec  # Optional: decode NewsAPI payloads straight into structs
+except ImportError:
+    msgspec = None
+
+
+USER_AGENT = 'NewsTerminal/1.0'
+
+logger = logging.getLogger(__name__)
+
+
+def _create_shared_session() -> requests.Session:
+    """Create the process-wide HTTP session with pooled, retrying connections."""
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by every client so connection pools and keep-alive are reused
+_SHARED_SESSION = _create_shared_session()
+
+
+def fast_frozen_dataclass(cls=None, *, hash_fields: Optional[Tuple[str, ...]] = None):
+    """Dataclass decorator for value types that are immutable by convention.
+
+    Unlike ``frozen=True`` it keeps plain attribute stores in ``__init__``,
+    and the hash is computed once at construction instead of on every call.
+    Instances are slotted.
+    """
+    def wrap(cls):
+        user_post_init = cls.__dict__.get('__post_init__')
+        
+        def __post_init__(self):
+            if user_post_init is not None:
+                user_post_init(self)
+            self._hash = hash(tuple(getattr(self, name) for name in key_fields))
+        
+        # Reserve a slot for the cached hash
+        cls.__annotations__['_hash'] = int
+        cls._hash = field(default=0, init=False, repr=False, compare=False)
+        cls.__post_init__ = __post_init__
+        cls.__hash__ = lambda self: self._hash
+        cls = dataclass(eq=True, slots=True)(cls)
+        key_fields = hash_fields or tuple(f.name for f in fields(cls) if f.compare)
+        return cls
+    
+    return wrap if cls is None else wrap(cls)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert an offset-aware datetime to naive UTC; naive ones pass through."""
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp into a naive UTC datetime."""
+    try:
+        # C-level parser; handles the strict ISO output of NewsAPI and Guardian
+        return _naive_utc(datetime.fromisoformat(value))
+    except ValueError:
+        return _naive_utc(parser.parse(value))
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most ``limit`` characters, without copying short strings."""
+    return text if len(text) <= limit else text[:limit]
+
+
+@lru_cache(maxsize=1440)
+def _hhmm(hour: int, minute: int) -> str:
+    """Format an hour/minute pair as HH:MM (one entry per minute of the day)."""
+    return f"{hour:02d}:{minute:02d}"
+
+
+@fast_frozen_dataclass(hash_fields=('title', 'url', 'published_at'))
 class NewsArticle:
     """Immutable news article data structure."""
     title: str
@@ -21,45 +120,315 @@ class NewsArticle:
     source: str
     published_at: datetime
     category: str = 'general'
+    title_lower: str = field(default='', init=False, repr=False, compare=False)
+    search_text: str = field(default='', init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Few distinct values shared by many articles - keep one copy of each
+        self.source = sys.intern(self.source)
+        self.category = sys.intern(self.category.lower())
+        # Lowercased once here instead of in every dedup, search and keyword scan
+        self.title_lower = self.title.lower()
+        self.search_text = f"{self.title_lower}\n{(self.description or '').lower()}"
     
     @property
     def formatted_time(self) -> str:
         """Format publication time for display."""
-        return self.published_at.strftime("%H:%M")
+        return _hhmm(self.published_at.hour, self.published_at.minute)
+
+
+_PUBLISHED_AT = attrgetter('published_at')
+
+
+@dataclass(frozen=True, slots=True)
+class NewsArticleBatch:
+    """Column-oriented view of a list of articles.
+    
+    Aggregate queries touch only the column they need instead of
+    walking every article object.
+    """
+    articles: Tuple[NewsArticle, ...]
+    sources: Tuple[str, ...]
+    categories: Tuple[str, ...]
+    search_text: Tuple[str, ...]  # Lowercased title and description
+    published_ts: array  # POSIX timestamps, parallel to ``articles``
+    
+    @classmethod
+    def from_articles(cls, articles: List[NewsArticle]) -> 'NewsArticleBatch':
+        """Build the columns from a list of articles."""
+        return cls(
+            articles=tuple(articles),
+            sources=tuple(article.source for article in articles),
+            categories=tuple(article.category for article in articles),
+            search_text=tuple(article.search_text for article in articles),
+            published_ts=array('d', (article.published_at.timestamp() for article in articles))
+        )
+    
+    def __len__(self) -> int:
+        return len(self.articles)
+    
+    def top_by_source(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Get the ``n`` sources with the most articles."""
+        return Counter(self.sources).most_common(n)
+    
+    def in_category(self, category: str) -> List[NewsArticle]:
+        """Get articles in a category (case-insensitive)."""
+        target = category.lower()
+        articles = self.articles
+        return [articles[i] for i, cat in enumerate(self.categories) if cat == target]
+    
+    def search(self, query: str) -> List[NewsArticle]:
+        """Get articles whose title or description contains ``query`` (case-insensitive)."""
+        needle = query.lower()
+        articles = self.articles
+        return [articles[i] for i, text in enumerate(self.search_text) if needle in text]
+    
+    def newest(self, n: Optional[int] = None) -> List[NewsArticle]:
+        """Get articles newest-first, optionally only the top ``n``."""
+        timestamps = self.published_ts
+        if n is None:
+            order = sorted(range(len(timestamps)), key=timestamps.__getitem__, reverse=True)
+        else:
+            order = heapq.nlargest(n, range(len(timestamps)), key=timestamps.__getitem__)
+        articles = self.articles
+        return [articles[i] for i in order]
+
+
+# (url, params) -> (etag, last_modified, parsed body) for conditional GETs
+_ETagCache = Dict[Tuple[str, tuple], Tuple[Optional[str], Optional[str], Any]]
+
+
+def _revalidation_headers(headers: Dict[str, str], cached) -> Dict[str, str]:
+    """Add If-None-Match/If-Modified-Since for a cached response to ``headers``."""
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _remember_response(cache: _ETagCache, cache_key: Tuple[str, tuple],
+                       response_headers: Mapping[str, str], data: Any) -> None:
+    """Cache ``data`` for revalidation if the response carried validators."""
+    etag = response_headers.get('ETag')
+    last_modified = response_headers.get('Last-Modified')
+    if etag or last_modified:
+        cache[cache_key] = (etag, last_modified, data)
+
+
+class APIClientProto(Protocol):
+    """Structural type for anything that can fetch news articles."""
+    
+    def fetch_news(self, category: str = 'general', limit: int = 10) -> List[NewsArticle]:
+        ...
+    
+    async def fetch_news_async(self, category: str = 'general', limit: int = 10) -> List[NewsArticle]:
+        ...
 
 
-class APIClient(ABC):
-    """Abstract base class for API clients."""
+class APIClient:
+    """Base class for API clients."""
+    
+    __slots__ = ('api_key', 'timeout', 'session', 'headers', '_etag_cache')
     
     def __init__(self, api_key: Optional[str] = None, timeout: int = 10):
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = _SHARED_SESSION
+        self.headers: Dict[str, str] = {}  # Per-client headers; the session is shared
+        self._etag_cache: _ETagCache = {}
     
-    @abstractmethod
     def fetch_news(self, category: str = 'general', limit: int = 10) -> List[NewsArticle]:
         """Fetch news articles from the API."""
-        pass
+        raise NotImplementedError
     
-    def _make_request(self, url: str, params: Optional[dict] = None) -> Optional[dict]:
-        """Make HTTP request with error handling."""
+    def _make_request(self, url: str, params: Optional[dict] = None,
+                      decode: Optional[Callable[[bytes], Any]] = None) -> Optional[Any]:
+        """Make HTTP request with error handling and ETag/Last-Modified revalidation.
+        
+        ``decode`` turns the raw body into the returned value; it defaults to
+        plain JSON decoding and must raise ValueError on malformed input.
+        """
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(cache_key)
+        headers = _revalidation_headers(dict(self.headers), cached)
+        
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(url, params=params, headers=headers or None, timeout=self.timeout)
+            if response.status_code == 304 and cached:
+                return cached[2]
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException:
+            if decode is not None:
+                data = decode(response.content)
+            else:
+                data = orjson.loads(response.content) if orjson else response.json()
+        except (requests.exceptions.RequestException, ValueError):
             return None
+        
+        _remember_response(self._etag_cache, cache_key, response.headers, data)
+        return data
+    
+    async def fetch_news_async(self, category: str = 'general', limit: int = 10) -> List[NewsArticle]:
+        """Fetch news without blocking the event loop."""
+        return await asyncio.to_thread(self.fetch_news, category, limit)
+
+
+# Synchronous fetches of async clients all run on one background event loop,
+# so a single aiohttp session keeps its connections alive between refreshes
+_api_loop: Optional[asyncio.AbstractEventLoop] = None
+_api_loop_lock = threading.Lock()
+_api_http: Optional[aiohttp.ClientSession] = None  # Only touched on _api_loop
+
+# Retries for failed async requests, mirroring _SHARED_SESSION's Retry policy
+_ASYNC_RETRIES = 2
+_ASYNC_BACKOFF = 0.2
+
+
+def _api_event_loop() -> asyncio.AbstractEventLoop:
+    """Start the background API fetch loop on first use."""
+    global _api_loop
+    with _api_loop_lock:
+        if _api_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='api-fetch', daemon=True).start()
+            _api_loop = loop
+            atexit.register(_close_api_loop)
+        return _api_loop
+
+
+def _api_session() -> aiohttp.ClientSession:
+    """Return the persistent API session (call on the background loop)."""
+    global _api_http
+    if _api_http is None or _api_http.closed:
+        _api_http = aiohttp.ClientSession(
+            headers={'User-Agent': USER_AGENT},
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+        )
+    return _api_http
+
+
+def _close_api_loop() -> None:
+    """Close the shared API session and stop the background loop."""
+    global _api_loop
+    with _api_loop_lock:
+        loop, _api_loop = _api_loop, None
+    if loop is None:
+        return
+    
+    async def close_http() -> None:
+        global _api_http
+        if _api_http is not None:
+            await _api_http.close()
+            _api_http = None
+    
+    try:
+        asyncio.run_coroutine_threadsafe(close_http(), loop).result(timeout=10)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class AsyncAPIClient(APIClient):
+    """Base class for clients that issue their requests concurrently via aiohttp."""
+    
+    __slots__ = ()
+    
+    async def fetch_news_async(self, category: str = 'general', limit: int = 10,
+                               http: Optional[aiohttp.ClientSession] = None) -> List[NewsArticle]:
+        """Fetch news articles from the API.
+        
+        Uses ``http`` if given, otherwise a session opened for this call.
+        """
+        raise NotImplementedError
+    
+    async def _fetch_news_shared(self, category: str, limit: int) -> List[NewsArticle]:
+        """Fetch on the persistent session (runs on the background loop)."""
+        return await self.fetch_news_async(category, limit, _api_session())
+    
+    def fetch_news(self, category: str = 'general', limit: int = 10) -> List[NewsArticle]:
+        """Synchronous wrapper around fetch_news_async, safe to call from any thread."""
+        future = asyncio.run_coroutine_threadsafe(
+            self._fetch_news_shared(category, limit), _api_event_loop()
+        )
+        return future.result()
+    
+    def _client_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session for a single fetch outside the background loop."""
+        return aiohttp.ClientSession(headers={'User-Agent': USER_AGENT})
+    
+    async def _make_request_async(self, http: aiohttp.ClientSession, url: str,
+                                  params: Optional[dict] = None,
+                                  revalidate: bool = False) -> Optional[Any]:
+        """Make async HTTP request with error handling and retries.
+        
+        With ``revalidate`` the response is cached for ETag/Last-Modified
+        revalidation, as _make_request does for every request.
+        """
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(cache_key) if revalidate else None
+        headers = _revalidation_headers(dict(self.headers), cached)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        for attempt in range(_ASYNC_RETRIES + 1):
+            try:
+                async with http.get(url, params=params, headers=headers or None,
+                                    timeout=timeout) as response:
+                    if response.status == 304 and cached:
+                        return cached[2]
+                    response.raise_for_status()
+                    data = orjson.loads(await response.read()) if orjson else await response.json()
+                    response_headers = response.headers
+                break
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == _ASYNC_RETRIES:
+                    return None
+                await asyncio.sleep(_ASYNC_BACKOFF * 2 ** attempt)
+            except (aiohttp.ClientError, ValueError):
+                return None
+        
+        if revalidate:
+            _remember_response(self._etag_cache, cache_key, response_headers, data)
+        return data
+
+
+if msgspec is not None:
+    class _NewsAPISource(msgspec.Struct):
+        name: Optional[str] = None
+    
+    class _NewsAPIArticle(msgspec.Struct):
+        title: Optional[str] = None
+        description: Optional[str] = None
+        url: Optional[str] = None
+        publishedAt: Optional[str] = None
+        source: Optional[_NewsAPISource] = None
+    
+    class _NewsAPIResponse(msgspec.Struct):
+        articles: List[_NewsAPIArticle] = []
+    
+    _NEWSAPI_DECODER = msgspec.json.Decoder(_NewsAPIResponse)
+    
+    def _decode_newsapi(content: bytes) -> '_NewsAPIResponse':
+        """Decode a NewsAPI response body in a single pass."""
+        try:
+            return _NEWSAPI_DECODER.decode(content)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+else:
+    _decode_newsapi = None
 
 
 class NewsAPIClient(APIClient):
     """Client for NewsAPI.org - requires free API key."""
     
+    __slots__ = ()
+    
     BASE_URL = 'https://newsapi.org/v2'
     
     def __init__(self, api_key: str, timeout: int = 10):
         super().__init__(api_key, timeout)
         if api_key:
-            self.session.headers.update({'X-API-Key': api_key})
+            self.headers['X-API-Key'] = api_key
     
     def fetch_news(self, category: str = 'general', limit: int = 10) -> List[NewsArticle]:
         """Fetch top headlines from NewsAPI."""
@@ -72,6 +441,23 @@ class NewsAPIClient(APIClient):
             'pageSize': min(limit, 100)
         }
         
+        if _decode_newsapi is not None:
+            response = self._make_request(f"{self.BASE_URL}/top-headlines", params, decode=_decode_newsapi)
+            if response is None:
+                return []
+            return [
+                NewsArticle(
+                    title=article.title,
+                    description=article.description or '',
+                    url=article.url or '',
+                    source=(article.source.name if article.source else None) or 'NewsAPI',
+                    published_at=_parse_timestamp(article.publishedAt) if article.publishedAt else datetime.now(),
+                    category=category
+                )
+                for article in response.articles
+                if article.title and article.title != '[Removed]'
+            ]
+        
         data = self._make_request(f"{self.BASE_URL}/top-headlines", params)
         if not data or 'articles' not in data:
             return []
@@ -82,7 +468,7 @@ class NewsAPIClient(APIClient):
                 description=article['description'] or '',
                 url=article['url'] or '',
                 source=article['source']['name'] if article.get('source') else 'NewsAPI',
-                published_at=parser.parse(article['publishedAt']).replace(tzinfo=None) if article.get('publishedAt') else datetime.now(),
+                published_at=_parse_timestamp(article['publishedAt']) if article.get('publishedAt') else datetime.now(),
                 category=category
             )
             for article in data['articles']
@@ -90,26 +476,40 @@ class NewsAPIClient(APIClient):
         ]
 
 
-class HackerNewsClient(APIClient):
+class HackerNewsClient(AsyncAPIClient):
     """Client for Hacker News API - free, no key required."""
     
+    __slots__ = ()
+    
     BASE_URL = 'https://hacker-news.firebaseio.com/v0'
     
-    def fetch_news(self, category: str = 'technology', limit: int = 10) -> List[NewsArticle]:
+    async def fetch_news_async(self, category: str = 'technology', limit: int = 10,
+                               http: Optional[aiohttp.ClientSession] = None) -> List[NewsArticle]:
         """Fetch top stories from Hacker News."""
-        # Get top story IDs
-        story_ids = self._make_request(f"{self.BASE_URL}/topstories.json")
+        if http is None:
+            async with self._client_session() as http:
+                return await self.fetch_news_async(category, limit, http)
+        
+        # Get top story IDs; the list is revalidated, items change too often
+        story_ids = await self._make_request_async(
+            http, f"{self.BASE_URL}/topstories.json", revalidate=True
+        )
         if not story_ids:
             return []
         
+        # Fetch all stories concurrently instead of one round trip each
+        stories = await asyncio.gather(*[
+            self._make_request_async(http, f"{self.BASE_URL}/item/{story_id}.json")
+            for story_id in story_ids[:limit]
+        ])
+        
         articles = []
-        for story_id in story_ids[:limit]:
-            story = self._make_request(f"{self.BASE_URL}/item/{story_id}.json")
+        for story in stories:
             if story and story.get('type') == 'story' and story.get('url'):
                 articles.append(
                     NewsArticle(
                         title=story.get('title', 'No title'),
-                        description=story.get('text', '')[:200] if story.get('text') else '',
+                        description=_truncate(story.get('text') or '', 200),
                         url=story.get('url', ''),
                         source='Hacker News',
                         published_at=datetime.fromtimestamp(story.get('time', time.time())),
@@ -120,48 +520,64 @@ class HackerNewsClient(APIClient):
         return articles
 
 
+# Category -> subreddit
+_SUBREDDIT_MAP: Mapping[str, str] = MappingProxyType({
+    'general': 'news',
+    'technology': 'technology',
+    'business': 'business',
+    'science': 'science',
+    'politics': 'politics'
+})
+
+# Category -> Guardian search term
+_GUARDIAN_SEARCH_MAP: Mapping[str, str] = MappingProxyType({
+    'business': 'business finance',
+    'technology': 'technology',
+    'science': 'science',
+    'politics': 'politics',
+    'general': 'news'
+})
+
+
 class RedditNewsClient(APIClient):
     """Client for Reddit API - free, no key required."""
     
+    __slots__ = ()
+    
     BASE_URL = 'https://www.reddit.com'
     
     def fetch_news(self, category: str = 'general', limit: int = 10) -> List[NewsArticle]:
         """Fetch top posts from news subreddits."""
-        subreddit_map = {
-            'general': 'news',
-            'technology': 'technology',
-            'business': 'business',
-            'science': 'science',
-            'politics': 'politics'
-        }
-        
-        subreddit = subreddit_map.get(category, 'news')
+        subreddit = _SUBREDDIT_MAP.get(category, 'news')
         data = self._make_request(f"{self.BASE_URL}/r/{subreddit}/hot.json", {'limit': limit})
         
         if not data or 'data' not in data:
             return []
         
-        articles = []
-        for post in data['data']['children']:
-            post_data = post['data']
-            if not post_data.get('is_self') and post_data.get('url'):
-                articles.append(
-                    NewsArticle(
-                        title=post_data.get('title', 'No title'),
-                        description=post_data.get('selftext', '')[:200] if post_data.get('selftext') else '',
-                        url=post_data.get('url', ''),
-                        source=f"r/{subreddit}",
-                        published_at=datetime.fromtimestamp(post_data.get('created_utc', time.time())),
-                        category=category
-                    )
-                )
+        posts = [post['data'] for post in data['data']['children']]
+        source = f"r/{subreddit}"
+        now = time.time()
+        fromtimestamp = datetime.fromtimestamp
         
-        return articles
+        return [
+            NewsArticle(
+                title=post.get('title') or 'No title',
+                description=_truncate(post.get('selftext') or '', 200),
+                url=post['url'],
+                source=source,
+                published_at=fromtimestamp(post.get('created_utc', now)),
+                category=category
+            )
+            for post in posts
+            if not post.get('is_self') and post.get('url')
+        ]
 
 
 class GuardianAPIClient(APIClient):
     """Client for Guardian API - free, but requires API key."""
     
+    __slots__ = ()
+    
     BASE_URL = 'https://content.guardianapis.com'
     
     def __init__(self, api_key: Optional[str] = None, timeout: int = 10):
@@ -192,7 +608,7 @@ class GuardianAPIClient(APIClient):
                     description=item.get('fields', {}).get('standfirst', '') or '',
                     url=item.get('webUrl', ''),
                     source='The Guardian',
-                    published_at=parser.parse(item['webPublicationDate']).replace(tzinfo=None) if item.get('webPublicationDate') else datetime.now(),
+                    published_at=_parse_timestamp(item['webPublicationDate']) if item.get('webPublicationDate') else datetime.now(),
                     category=category
                 )
             )
@@ -202,48 +618,63 @@ class GuardianAPIClient(APIClient):
     @staticmethod
     def _get_search_term(category: str) -> str:
         """Map category to Guardian search term."""
-        mapping = {
-            'business': 'business finance',
-            'technology': 'technology',
-            'science': 'science',
-            'politics': 'politics',
-            'general': 'news'
-        }
-        return mapping.get(category, 'news')
+        return _GUARDIAN_SEARCH_MAP.get(category, 'news')
+
+
+_CLIENT_REGISTRY: Dict[Tuple[Optional[str], Optional[str]], List[APIClientProto]] = {}
+_CLIENT_REGISTRY_LOCK = threading.Lock()
 
 
-@lru_cache(maxsize=128)
 def get_api_clients(news_api_key: Optional[str] = None, 
-                   guardian_api_key: Optional[str] = None) -> List[APIClient]:
+                   guardian_api_key: Optional[str] = None) -> List[APIClientProto]:
     """Get configured API clients."""
-    clients = [
-        HackerNewsClient(),
-        RedditNewsClient()
-    ]
-    
-    if news_api_key:
-        clients.append(NewsAPIClient(news_api_key))
-    
-    if guardian_api_key:
-        clients.append(GuardianAPIClient(guardian_api_key))
-    
-    return clients
+    registry_key = (news_api_key, guardian_api_key)
+    with _CLIENT_REGISTRY_LOCK:
+        clients = _CLIENT_REGISTRY.get(registry_key)
+        if clients is not None:
+            return clients
+        
+        clients = [
+            HackerNewsClient(),
+            RedditNewsClient()
+        ]
+        
+        if news_api_key:
+            clients.append(NewsAPIClient(news_api_key))
+        
+        if guardian_api_key:
+            clients.append(GuardianAPIClient(guardian_api_key))
+        
+        _CLIENT_REGISTRY[registry_key] = clients
+        return clients
+
+
+def clear_api_clients() -> None:
+    """Drop all registered API clients."""
+    with _CLIENT_REGISTRY_LOCK:
+        _CLIENT_REGISTRY.clear()
 
 
 def fetch_all_news(category: str = 'general', 
                   limit_per_source: int = 5,
-                  api_keys: Optional[dict] = None) -> Generator[NewsArticle, None, None]:
-    """Fetch news from all available sources."""
+                  api_keys: Optional[dict] = None) -> Iterator[NewsArticle]:
+    """Fetch news from all available sources, merged newest-first."""
     api_keys = api_keys or {}
     clients = get_api_clients(
         news_api_key=api_keys.get('newsapi'),
         guardian_api_key=api_keys.get('guardian')
     )
     
+    per_client = []
     for client in clients:
         try:
             articles = client.fetch_news(category, limit_per_source)
-            yield from articles
-        except Exception:
-            # Skip failed sources silently
+        except Exception as e:
+            # A failed source only drops its own articles
+            logger.warning("Skipping %s: %s", type(client).__name__, e)
             continue
+        # Each run is small; sorting it lets the merge below stay linear
+        articles.sort(key=_PUBLISHED_AT, reverse=True)
+        per_client.append(articles)
+    
+    return heapq.merge(*per_client, key=_PUBLISHED_AT, reverse=True)
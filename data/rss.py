@@ -1,18 +1,30 @@
 """
 RSS feed handlers for various news sources.
 """
-from dataclasses import dataclass
+import asyncio
+import atexit
+import io
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from functools import lru_cache
-from typing import Dict, Generator, List, Optional
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Generator, List, Mapping, Optional, Tuple
 
+import aiohttp
 import feedparser
-from dateutil import parser
+from lxml import etree
 
-from data.api import NewsArticle
+from config import DEFAULT_CONFIG
+from data.api import (
+    USER_AGENT, NewsArticle, _naive_utc, _parse_timestamp, _truncate, fast_frozen_dataclass
+)
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass
 class RSSFeed:
     """RSS feed configuration."""
     name: str
@@ -21,61 +33,257 @@ class RSSFeed:
     priority: int = 1  # Higher number = higher priority
 
 
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+# RSS 2.0 <item>, RSS 1.0/RDF <item> (namespaced) and Atom <entry>
+FEED_ITEM_TAGS = ('{*}item', '{*}entry')
+
+# Parsed entry fields: (title, description, url, published_at)
+_FeedRecord = Tuple[str, str, str, datetime]
+
+# Conditional GET state per feed URL: (ETag, Last-Modified, parsed limit, articles)
+_feed_cache: Dict[str, Tuple[Optional[str], Optional[str], int, List[NewsArticle]]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> Optional[datetime]:
+    """Parse an RSS/Atom date string into a naive UTC datetime, or None if unparseable."""
+    try:
+        # RFC 822 (RSS pubDate) through the stdlib email parser
+        return _naive_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        # ISO 8601 (Atom); dateutil only if fromisoformat gives up. Both
+        # branches convert offsets to UTC the same way
+        return _parse_timestamp(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _parse_pub_date(value: Optional[str]) -> datetime:
+    """Parse an RSS/Atom date into a naive datetime, defaulting to now.
+    
+    Parses are memoized per date string: a feed repeats most of its entries
+    from one refresh to the next.
+    """
+    published_at = _parse_date_string(value) if value else None
+    return published_at if published_at is not None else datetime.now()
+
+
+def _atom_link(elem) -> Optional[str]:
+    """Return the href of an Atom entry's alternate link (or of one without ``rel``)."""
+    for link_elem in elem.iterfind(f'{ATOM_NS}link'):
+        if link_elem.get('rel', 'alternate') == 'alternate':
+            return link_elem.get('href')
+    return None
+
+
+def _element_record(elem) -> _FeedRecord:
+    """Extract the fields of an RSS ``<item>`` or Atom ``<entry>`` element."""
+    qname = etree.QName(elem)
+    if qname.localname == 'item':
+        # RSS 2.0 items are un-namespaced, RSS 1.0 items share the RDF feed's namespace
+        ns = f'{{{qname.namespace}}}' if qname.namespace else ''
+        title = elem.findtext(f'{ns}title')
+        link = elem.findtext(f'{ns}link')
+        summary = elem.findtext(f'{ns}description')
+        published = elem.findtext('pubDate') or elem.findtext(f'{DC_NS}date')
+    else:
+        title = elem.findtext(f'{ATOM_NS}title')
+        link = _atom_link(elem)
+        summary = elem.findtext(f'{ATOM_NS}summary') or elem.findtext(f'{ATOM_NS}content')
+        published = elem.findtext(f'{ATOM_NS}published') or elem.findtext(f'{ATOM_NS}updated')
+    
+    return (
+        (title or '').strip() or 'No title',
+        _truncate(summary.strip(), 300) if summary else '',
+        (link or '').strip(),
+        _parse_pub_date(published)
+    )
+
+
+def _entry_record(entry) -> _FeedRecord:
+    """Extract the fields of a feedparser entry."""
+    # Prefer feedparser's pre-parsed UTC tuple over re-parsing the string
+    published_parsed = entry.get('published_parsed')
+    if published_parsed:
+        pub_date = datetime(*published_parsed[:6])
+    else:
+        pub_date = _parse_pub_date(entry.get('published'))
+    
+    return (
+        entry.get('title', 'No title'),
+        _truncate(entry.get('summary') or '', 300),
+        entry.get('link', ''),
+        pub_date
+    )
+
+
+def _parse_feed_records(body: bytes, limit: int) -> List[_FeedRecord]:
+    """Parse up to ``limit`` entries from a feed body, inline or in a parse worker.
+    
+    Returns plain tuples rather than articles: articles hash their strings
+    at construction and string hashes are salted per process.
+    """
+    records: List[_FeedRecord] = []
+    if limit <= 0:
+        return records
+    
+    try:
+        # Remote XML: never expand entities or fetch external resources
+        items = etree.iterparse(
+            io.BytesIO(body), events=('end',), tag=FEED_ITEM_TAGS,
+            resolve_entities=False, no_network=True
+        )
+        for _, elem in items:
+            records.append(_element_record(elem))
+            elem.clear()
+            if len(records) >= limit:
+                break
+    except etree.XMLSyntaxError:
+        records = []
+    
+    if not records:
+        # Malformed XML, or a well-formed feed whose items we don't recognise -
+        # let feedparser have a go
+        return [_entry_record(entry) for entry in feedparser.parse(body).entries[:limit]]
+    return records
+
+
+def _record_article(feed: 'RSSFeed', record: _FeedRecord) -> NewsArticle:
+    """Build an article of ``feed`` from parsed entry fields."""
+    title, description, url, published_at = record
+    return NewsArticle(
+        title=title,
+        description=description,
+        url=url,
+        source=feed.name,
+        published_at=published_at,
+        category=feed.category
+    )
+
+
+# Bodies up to this size parse inline on the fetch loop; a worker process
+# only pays off once pickling the body costs less than the parse it offloads
+_INLINE_PARSE_MAX_BYTES = 256 * 1024
+
+# Worker processes for large feed bodies, started on first use. Each spawned
+# worker re-imports the app, so keep the pool small
+_PARSE_POOL_WORKERS = 2
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared feed parsing pool, creating it if needed."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Spawned, not forked: the parent runs fetch and display threads
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=_PARSE_POOL_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _parse_pool
+
+
+def _conditional_headers(url: str, limit: int) -> Dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers from the last fetch of ``url``."""
+    cached = _feed_cache.get(url)
+    # A shallower cached parse cannot answer a deeper request
+    if cached is None or cached[2] < limit:
+        return {}
+    
+    etag, last_modified = cached[0], cached[1]
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _cached_articles(url: str, limit: int) -> List[NewsArticle]:
+    """Return the articles parsed on the last successful fetch of ``url``."""
+    cached = _feed_cache.get(url)
+    return cached[3][:limit] if cached is not None else []
+
+
+def _remember_feed(url: str, response_headers: Mapping[str, str], limit: int,
+                   articles: List[NewsArticle]) -> List[NewsArticle]:
+    """Store validators and articles from a 200 response for later conditional GETs."""
+    etag = response_headers.get('ETag')
+    last_modified = response_headers.get('Last-Modified')
+    if etag or last_modified:
+        _feed_cache[url] = (etag, last_modified, limit, articles)
+    return articles
+
+
+# Default RSS feeds organized by category, fixed at import
+_DEFAULT_FEEDS_BY_CAT: Mapping[str, Tuple[RSSFeed, ...]] = MappingProxyType({
+    'financial': (
+        RSSFeed('Reuters Business', 'https://feeds.reuters.com/reuters/businessNews', 'business', 3),
+        RSSFeed('MarketWatch', 'https://feeds.marketwatch.com/marketwatch/realtimeheadlines/', 'business', 3),
+        RSSFeed('Yahoo Finance', 'https://feeds.finance.yahoo.com/rss/2.0/headline', 'business', 2),
+        RSSFeed('CNN Business', 'http://rss.cnn.com/rss/money_latest.rss', 'business', 2),
+        RSSFeed('Bloomberg', 'https://feeds.bloomberg.com/markets/news.rss', 'business', 3),
+        RSSFeed('Financial Times', 'https://www.ft.com/rss/home', 'business', 3),
+        RSSFeed('Wall Street Journal', 'https://feeds.wsj.com/wsj/xml/rss/3_7085.xml', 'business', 3),
+        RSSFeed('Seeking Alpha', 'https://seekingalpha.com/api/sa/combined/A.xml', 'business', 2),
+    ),
+    'earnings': (
+        RSSFeed('Earnings Whispers', 'https://www.earningswhispers.com/rss/epsrss.asp', 'business', 3),
+        RSSFeed('Yahoo Earnings', 'https://feeds.finance.yahoo.com/rss/2.0/headline?s=earnings', 'business', 3),
+    ),
+    'technology': (
+        RSSFeed('TechCrunch', 'https://feeds.feedburner.com/TechCrunch/', 'technology', 3),
+        RSSFeed('Ars Technica', 'https://feeds.arstechnica.com/arstechnica/index', 'technology', 3),
+        RSSFeed('The Verge', 'https://www.theverge.com/rss/index.xml', 'technology', 2),
+        RSSFeed('Wired', 'https://www.wired.com/feed/rss', 'technology', 2),
+        RSSFeed('VentureBeat', 'https://venturebeat.com/feed/', 'technology', 2),
+    ),
+    'crypto': (
+        RSSFeed('CoinDesk', 'https://feeds.coindesk.com/coindesk-results', 'business', 3),
+        RSSFeed('Cointelegraph', 'https://cointelegraph.com/rss', 'business', 2),
+        RSSFeed('Decrypt', 'https://decrypt.co/feed', 'business', 2),
+        RSSFeed('CryptoNews', 'https://cryptonews.com/news/feed/', 'business', 2),
+    ),
+    'general': (
+        RSSFeed('BBC News', 'http://feeds.bbci.co.uk/news/rss.xml', 'general', 3),
+        RSSFeed('Reuters World', 'https://feeds.reuters.com/Reuters/worldNews', 'general', 3),
+        RSSFeed('AP News', 'https://feeds.apnews.com/apnews/World', 'general', 2),
+        RSSFeed('NPR', 'https://feeds.npr.org/1001/rss.xml', 'general', 2),
+    ),
+    'politics': (
+        RSSFeed('Politico', 'https://www.politico.com/rss/politics08.xml', 'politics', 3),
+        RSSFeed('Reuters Politics', 'https://feeds.reuters.com/reuters/politicsNews', 'politics', 2),
+        RSSFeed('The Hill', 'https://thehill.com/news/feed/', 'politics', 2),
+    ),
+    'energy': (
+        RSSFeed('Oil & Gas Journal', 'https://www.ogj.com/rss.xml', 'business', 2),
+        RSSFeed('Energy News', 'https://www.energy-news.co.uk/feed/', 'business', 2),
+    )
+})
+
+# Flat view of every default feed
+_DEFAULT_FEEDS: Tuple[RSSFeed, ...] = tuple(chain.from_iterable(_DEFAULT_FEEDS_BY_CAT.values()))
+
+
 class RSSFeedManager:
     """Manager for RSS feed operations."""
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, max_workers: Optional[int] = None):
         self.timeout = timeout
-        self._feeds = self._get_default_feeds()
-    
-    @staticmethod
-    @lru_cache(maxsize=1)
-    def _get_default_feeds() -> Dict[str, List[RSSFeed]]:
-        """Get default RSS feeds organized by category."""
-        return {
-            'financial': [
-                RSSFeed('Reuters Business', 'https://feeds.reuters.com/reuters/businessNews', 'business', 3),
-                RSSFeed('MarketWatch', 'https://feeds.marketwatch.com/marketwatch/realtimeheadlines/', 'business', 3),
-                RSSFeed('Yahoo Finance', 'https://feeds.finance.yahoo.com/rss/2.0/headline', 'business', 2),
-                RSSFeed('CNN Business', 'http://rss.cnn.com/rss/money_latest.rss', 'business', 2),
-                RSSFeed('Bloomberg', 'https://feeds.bloomberg.com/markets/news.rss', 'business', 3),
-                RSSFeed('Financial Times', 'https://www.ft.com/rss/home', 'business', 3),
-                RSSFeed('Wall Street Journal', 'https://feeds.wsj.com/wsj/xml/rss/3_7085.xml', 'business', 3),
-                RSSFeed('Seeking Alpha', 'https://seekingalpha.com/api/sa/combined/A.xml', 'business', 2),
-            ],
-            'earnings': [
-                RSSFeed('Earnings Whispers', 'https://www.earningswhispers.com/rss/epsrss.asp', 'business', 3),
-                RSSFeed('Yahoo Earnings', 'https://feeds.finance.yahoo.com/rss/2.0/headline?s=earnings', 'business', 3),
-            ],
-            'technology': [
-                RSSFeed('TechCrunch', 'https://feeds.feedburner.com/TechCrunch/', 'technology', 3),
-                RSSFeed('Ars Technica', 'https://feeds.arstechnica.com/arstechnica/index', 'technology', 3),
-                RSSFeed('The Verge', 'https://www.theverge.com/rss/index.xml', 'technology', 2),
-                RSSFeed('Wired', 'https://www.wired.com/feed/rss', 'technology', 2),
-                RSSFeed('VentureBeat', 'https://venturebeat.com/feed/', 'technology', 2),
-            ],
-            'crypto': [
-                RSSFeed('CoinDesk', 'https://feeds.coindesk.com/coindesk-results', 'business', 3),
-                RSSFeed('Cointelegraph', 'https://cointelegraph.com/rss', 'business', 2),
-                RSSFeed('Decrypt', 'https://decrypt.co/feed', 'business', 2),
-                RSSFeed('CryptoNews', 'https://cryptonews.com/news/feed/', 'business', 2),
-            ],
-            'general': [
-                RSSFeed('BBC News', 'http://feeds.bbci.co.uk/news/rss.xml', 'general', 3),
-                RSSFeed('Reuters World', 'https://feeds.reuters.com/Reuters/worldNews', 'general', 3),
-                RSSFeed('AP News', 'https://feeds.apnews.com/apnews/World', 'general', 2),
-                RSSFeed('NPR', 'https://feeds.npr.org/1001/rss.xml', 'general', 2),
-            ],
-            'politics': [
-                RSSFeed('Politico', 'https://www.politico.com/rss/politics08.xml', 'politics', 3),
-                RSSFeed('Reuters Politics', 'https://feeds.reuters.com/reuters/politicsNews', 'politics', 2),
-                RSSFeed('The Hill', 'https://thehill.com/news/feed/', 'politics', 2),
-            ],
-            'energy': [
-                RSSFeed('Oil & Gas Journal', 'https://www.ogj.com/rss.xml', 'business', 2),
-                RSSFeed('Energy News', 'https://www.energy-news.co.uk/feed/', 'business', 2),
-            ]
+        self.max_workers = max_workers or DEFAULT_CONFIG.news.concurrent_workers
+        self._feeds: Dict[str, List[RSSFeed]] = {
+            category: list(feeds) for category, feeds in _DEFAULT_FEEDS_BY_CAT.items()
         }
+        # Synchronous fetches run on one background event loop so a single
+        # aiohttp session keeps its connections alive between refreshes
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._http: Optional[aiohttp.ClientSession] = None  # Only touched on self._loop
     
     def add_feed(self, category: str, feed: RSSFeed) -> None:
         """Add a new RSS feed to a category."""
@@ -93,56 +301,148 @@ class RSSFeedManager:
     
     def fetch_from_feed(self, feed: RSSFeed, limit: int = 10) -> List[NewsArticle]:
         """Fetch articles from a single RSS feed."""
+        return list(self._fetch_feeds([feed], limit))
+    
+    async def fetch_from_feed_async(self, http: aiohttp.ClientSession, feed: RSSFeed,
+                                    limit: int = 10) -> List[NewsArticle]:
+        """Fetch articles from a single RSS feed on an aiohttp session."""
         try:
-            parsed_feed = feedparser.parse(feed.url)
-            
-            if not parsed_feed.entries:
-                return []
-            
-            articles = []
-            for entry in parsed_feed.entries[:limit]:
-                # Parse publication date
-                pub_date = datetime.now()
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    pub_date = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'published') and entry.published:
-                    try:
-                        pub_date = parser.parse(entry.published).replace(tzinfo=None)
-                    except (ValueError, TypeError):
-                        pass
-                
-                articles.append(
-                    NewsArticle(
-                        title=entry.get('title', 'No title'),
-                        description=entry.get('summary', '')[:300] if entry.get('summary') else '',
-                        url=entry.get('link', ''),
-                        source=feed.name,
-                        published_at=pub_date,
-                        category=feed.category
-                    )
+            async with http.get(feed.url, headers=_conditional_headers(feed.url, limit)) as response:
+                if response.status == 304:
+                    # Unchanged since the last poll - skip download and parse
+                    return _cached_articles(feed.url, limit)
+                response.raise_for_status()
+                body = await response.read()
+                response_headers = response.headers
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return []
+        
+        try:
+            if len(body) <= _INLINE_PARSE_MAX_BYTES:
+                records = _parse_feed_records(body, limit)
+            else:
+                # Large bodies parse in a worker process instead of holding
+                # the GIL on the fetch loop
+                records = await asyncio.get_running_loop().run_in_executor(
+                    _get_parse_pool(), _parse_feed_records, body, limit
                 )
-            
-            return articles
-            
         except Exception:
             return []
+        
+        articles = [_record_article(feed, record) for record in records]
+        return _remember_feed(feed.url, response_headers, limit, articles)
+    
+    async def fetch_feeds_async(self, feeds: List[RSSFeed], limit_per_feed: int,
+                                http: Optional[aiohttp.ClientSession] = None) -> List[NewsArticle]:
+        """Fetch several feeds concurrently on one event loop.
+        
+        Uses ``http`` if given, otherwise a session opened for this call.
+        """
+        if http is None:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with aiohttp.ClientSession(timeout=timeout, headers={'User-Agent': USER_AGENT}) as http:
+                return await self.fetch_feeds_async(feeds, limit_per_feed, http)
+        
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def bounded(feed: RSSFeed) -> List[NewsArticle]:
+            async with semaphore:
+                return await self.fetch_from_feed_async(http, feed, limit_per_feed)
+        
+        results = await asyncio.gather(
+            *[bounded(feed) for feed in feeds],
+            return_exceptions=True
+        )
+        
+        return [
+            article
+            for result in results if isinstance(result, list)
+            for article in result
+        ]
+    
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background fetch loop on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='rss-fetch', daemon=True).start()
+                self._loop = loop
+                atexit.register(self.close)
+            return self._loop
+    
+    async def _fetch_feeds_shared(self, feeds: List[RSSFeed], limit_per_feed: int) -> List[NewsArticle]:
+        """Fetch feeds on the persistent session (runs on the background loop)."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': USER_AGENT},
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+        return await self.fetch_feeds_async(feeds, limit_per_feed, http=self._http)
+    
+    def _fetch_feeds(self, feeds: List[RSSFeed], limit_per_feed: int) -> Generator[NewsArticle, None, None]:
+        """Synchronous wrapper around fetch_feeds_async, safe to call from any thread."""
+        future = asyncio.run_coroutine_threadsafe(
+            self._fetch_feeds_shared(feeds, limit_per_feed), self._event_loop()
+        )
+        yield from future.result()
+    
+    def close(self) -> None:
+        """Close the shared session and stop the background fetch loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        
+        async def close_http() -> None:
+            if self._http is not None:
+                await self._http.close()
+                self._http = None
+        
+        try:
+            asyncio.run_coroutine_threadsafe(close_http(), loop).result(timeout=self.timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
     
     def fetch_category_news(self, category: str, limit_per_feed: int = 5) -> Generator[NewsArticle, None, None]:
         """Fetch news from all feeds in a category."""
         feeds = self.get_feeds_by_category(category)
         
-        # Sort by priority (higher first)
+        # Sort by priority (higher first) so important feeds are submitted first
         feeds.sort(key=lambda f: f.priority, reverse=True)
         
-        for feed in feeds:
-            articles = self.fetch_from_feed(feed, limit_per_feed)
-            yield from articles
+        yield from self._fetch_feeds(feeds, limit_per_feed)
+    
+    def fetch_categories_news(self, categories: List[str],
+                              limit_per_feed: int = 5) -> Generator[NewsArticle, None, None]:
+        """Fetch news from the feeds of several categories in one batch.
+        
+        A feed listed under more than one of the categories is fetched once.
+        """
+        feeds = list({
+            feed.url: feed
+            for category in categories
+            for feed in self.get_feeds_by_category(category)
+        }.values())
+        feeds.sort(key=lambda f: f.priority, reverse=True)
+        yield from self._fetch_feeds(feeds, limit_per_feed)
     
     def fetch_all_news(self, limit_per_feed: int = 3) -> Generator[NewsArticle, None, None]:
         """Fetch news from all feeds across all categories."""
-        for category in self._feeds:
-            yield from self.fetch_category_news(category, limit_per_feed)
+        feeds = [feed for category_feeds in self._feeds.values() for feed in category_feeds]
+        feeds.sort(key=lambda f: f.priority, reverse=True)
+        yield from self._fetch_feeds(feeds, limit_per_feed)
+
+
+# Global RSS manager instance, created on first access
+_rss_manager: Optional[RSSFeedManager] = None
 
 
-# Create global RSS manager instance
-rss_manager = RSSFeedManager()
+def __getattr__(name: str):
+    """Lazily construct module-level singletons (PEP 562)."""
+    global _rss_manager
+    if name == 'rss_manager':
+        if _rss_manager is None:
+            _rss_manager = RSSFeedManager()
+        return _rss_manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
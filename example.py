@@ -3,9 +3,13 @@
 Example usage of the News Terminal API
 """
 from src.aggregator import news_aggregator
+from src.logging_setup import configure_logging
 
 def main():
     """Example usage."""
+    # The aggregator no longer configures logging itself
+    configure_logging('example.log', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
     print("🔄 Fetching latest news...")
     
     # Fetch news from specific categories
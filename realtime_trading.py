@@ -6,28 +6,48 @@ High-frequency news aggregation with sub-second updates for professional trading
 """
 import argparse
 import asyncio
+import json
 import logging
+import re
 import sys
 from datetime import datetime
 from typing import List
 
+try:
+    import orjson  # Optional: faster JSON output in fetch mode
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional: faster event loop for the async fetch paths
+except ImportError:
+    uvloop = None
+
 from config import DEFAULT_CONFIG
-from src.realtime_aggregator import realtime_aggregator, RealTimeNews
-from src.display import terminal_display, simple_display
-from src.menu import TopicMenu
+from src.logging_setup import configure_logging
+
+# Headline markers flagged in continuous fetch mode
+_BREAKING_RE = re.compile(r'\b(?:breaking|urgent|alert)\b', re.IGNORECASE)
+
+
+def _write_json(data) -> None:
+    """Write ``data`` to stdout as indented JSON."""
+    if orjson is not None:
+        # orjson emits bytes and serializes datetimes natively
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(data, indent=2, default=datetime.isoformat))
 
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging for real-time trading application."""
-    level = logging.DEBUG if verbose else logging.WARNING
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S',
-        handlers=[
-            logging.FileHandler('realtime_trading.log'),
-            logging.StreamHandler() if verbose else logging.NullHandler()
-        ]
+    configure_logging(
+        'realtime_trading.log',
+        '%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
+        verbose,
+        datefmt='%H:%M:%S'
     )
 
 
@@ -52,17 +72,17 @@ def run_realtime_trading_mode(categories: List[str], simple_mode: bool = False)
     if not validate_config():
         sys.exit(1)
     
-    # Create sync wrapper for the display system
+    # Import here to avoid circular import; rich loads only for the display modes
+    from src.aggregator import AggregatedNews, news_aggregator
+    from src.display import terminal_display, simple_display
+    
+    # The live display already fetches on its own worker thread, so this
+    # wrapper only has to turn a failed fetch into an empty aggregation
     def get_news_sync():
-        # Use the faster aggregation but in sync mode
         try:
-            # Import here to avoid circular import
-            from src.aggregator import news_aggregator
             return news_aggregator.fetch_news_concurrent(categories)
         except Exception as e:
-            logging.error(f"Error fetching news: {e}")
-            # Return empty news
-            from src.aggregator import AggregatedNews
+            logging.error("Error fetching news: %s", e)
             return AggregatedNews(
                 articles=[],
                 last_updated=datetime.now(),
@@ -85,36 +105,41 @@ def run_realtime_trading_mode(categories: List[str], simple_mode: bool = False)
     except KeyboardInterrupt:
         print("\n👋 Real-time trading terminal stopped")
     except Exception as e:
-        logging.error(f"Fatal error in real-time mode: {e}")
+        logging.error("Fatal error in real-time mode: %s", e)
         print(f"❌ Fatal Error: {str(e)}")
         sys.exit(1)
 
 
 def run_realtime_fetch_mode(categories: List[str], output_format: str = 'text') -> None:
     """Run in real-time fetch mode - continuous news output."""
+    from src.realtime_aggregator import realtime_aggregator
+    
     async def fetch_and_display():
         print(f"📊 Real-Time News Feed - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"📡 Categories: {', '.join(categories)}")
         print("=" * 80)
         
+        interval = DEFAULT_CONFIG.terminal.trading_news_fetch_interval
+        clock = asyncio.get_running_loop().time
         try:
             while True:
+                # Next tick is due one interval after this fetch starts
+                deadline = clock() + interval
                 news = await realtime_aggregator.fetch_real_time_news(categories)
                 
                 if output_format == 'json':
-                    import json
                     articles_data = [
                         {
                             'title': article.title,
                             'description': article.description,
                             'url': article.url,
                             'source': article.source,
-                            'published_at': article.published_at.isoformat(),
+                            'published_at': article.published_at,
                             'category': article.category
                         }
                         for article in news.articles[:10]  # Latest 10 for real-time
                     ]
-                    print(json.dumps(articles_data, indent=2))
+                    _write_json(articles_data)
                 else:
                     # Real-time text output
                     print(f"\n🕐 {datetime.now().strftime('%H:%M:%S')} | "
@@ -123,18 +148,15 @@ def run_realtime_fetch_mode(categories: List[str], output_format: str = 'text')
                           f"⚡ {news.update_frequency:.1f} updates/sec")
                     
                     for article in news.articles[:5]:  # Show top 5 for real-time
-                        breaking_indicator = "🚨 " if any(
-                            keyword in article.title.lower() 
-                            for keyword in ['breaking', 'urgent', 'alert']
-                        ) else ""
+                        breaking_indicator = "🚨 " if _BREAKING_RE.search(article.title) else ""
                         
                         print(f"\n{breaking_indicator}[{article.published_at.strftime('%H:%M')}] "
                               f"{article.source} - {article.category.upper()}")
                         print(f"🔗 {article.title}")
                         print(f"   {article.url}")
                 
-                # Real-time interval
-                await asyncio.sleep(DEFAULT_CONFIG.terminal.trading_news_fetch_interval)
+                # Real-time interval, less the time spent fetching and printing
+                await asyncio.sleep(max(0.0, deadline - clock()))
                 
         except KeyboardInterrupt:
             print("\n👋 Real-time feed stopped")
@@ -179,6 +201,10 @@ Examples:
     # Setup logging
     setup_logging(args.verbose)
     
+    # Every loop created from here on (fetch mode, the RSS fetch loop) is a uvloop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Determine categories
     if args.categories:
         categories = args.categories
@@ -186,7 +212,6 @@ Examples:
         categories = ['financial', 'business']  # Default for trading
     else:
         # Interactive menu
-        menu = TopicMenu()
         if args.simple:
             # Simple menu for basic terminals
             print("Select topic:")
@@ -199,7 +224,8 @@ Examples:
             }
             categories = category_map.get(choice, ['financial', 'business'])
         else:
-            categories = menu.show_menu()
+            from src.menu import TopicMenu
+            categories = TopicMenu().show_menu()
         
         if not categories:
             print("👋 Goodbye!")
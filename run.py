@@ -13,21 +13,21 @@ from datetime import datetime
 from typing import List
 
 from config import DEFAULT_CONFIG
+from src.logging_setup import configure_logging
 from src.aggregator import news_aggregator
 from src.display import terminal_display, simple_display
 from src.menu import topic_menu, simple_topic_menu
 
+# Categories accepted on the command line: the ones the aggregator can fetch
+CATEGORIES = news_aggregator.categories
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging for the application."""
-    level = logging.DEBUG if verbose else logging.WARNING  # Changed from INFO to WARNING
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('news_terminal.log'),
-            logging.StreamHandler() if verbose else logging.NullHandler()
-        ]
+    configure_logging(
+        'news_terminal.log',
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        verbose
     )
 
 
@@ -82,7 +82,7 @@ def run_terminal_mode(categories: List[str], simple_mode: bool = False, interact
             run_terminal_mode(categories, simple_mode, interactive)
             
     except Exception as e:
-        logging.error(f"Fatal error: {e}")
+        logging.error("Fatal error: %s", e)
         print(f"❌ Fatal Error: {str(e)}")
         sys.exit(1)
 
@@ -120,7 +120,7 @@ def run_fetch_mode(categories: List[str], output_format: str = 'text') -> None:
                     print(f"   {article.description[:150]}...")
     
     except Exception as e:
-        logging.error(f"Error in fetch mode: {e}")
+        logging.error("Error in fetch mode: %s", e)
         print(f"❌ Error: {str(e)}")
         sys.exit(1)
 
@@ -145,8 +145,10 @@ Examples:
         '-c', '--categories',
         nargs='+',
         default=['financial', 'technology', 'business', 'earnings'],  # Trading-focused defaults
-        choices=['general', 'technology', 'business', 'politics', 'science', 'sports', 'entertainment', 'financial', 'crypto', 'earnings'],
-        help='News categories to display (default: financial, technology, business, earnings)'
+        choices=CATEGORIES,
+        metavar='CATEGORY',
+        help=f"News categories to display: {', '.join(sorted(CATEGORIES))} "
+             "(default: financial, technology, business, earnings)"
     )
     
     parser.add_argument(
@@ -1,19 +1,22 @@
 """
 Core news aggregation system that combines API and RSS sources.
 """
+import heapq
 import logging
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Set, Tuple
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
-from config import DEFAULT_CONFIG
-from data.api import NewsArticle, fetch_all_news
+from config import DEFAULT_CONFIG, NEWS_CATEGORIES
+from data.api import _PUBLISHED_AT, NewsArticle, NewsArticleBatch, fetch_all_news
 from data.rss import rss_manager
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AggregatedNews:
     """Container for aggregated news with metadata."""
     articles: List[NewsArticle]
@@ -22,33 +25,78 @@ class AggregatedNews:
     categories: Set[str]
 
 
+# Upper bound on fetch threads; they only ever wait on network I/O
+_MAX_FETCH_WORKERS = 64
+
+
+@lru_cache(maxsize=32)
+def _cache_key(categories: Tuple[str, ...]) -> str:
+    """Build the cache key for a sorted tuple of categories."""
+    return 'news_' + '-'.join(categories)
+
+
 class NewsCache:
-    """Enhanced in-memory cache for news articles with better invalidation."""
+    """Enhanced in-memory cache for news articles with better invalidation.
     
-    def __init__(self, cache_duration_minutes: int = 5):
+    Entries are kept oldest-first, so expired and surplus entries are
+    evicted from the front on every ``set``; the cache never holds more
+    than ``maxsize`` keys.
+    """
+    
+    def __init__(self, cache_duration_minutes: int = 5, maxsize: int = 256):
         self.cache_duration = timedelta(minutes=cache_duration_minutes)
-        self._cache: Dict[str, Tuple[List[NewsArticle], datetime]] = {}
-        self._last_api_call: Dict[str, datetime] = {}
+        self.maxsize = maxsize
+        # Timestamps are time.monotonic() readings, immune to wall-clock jumps
+        self._cache: OrderedDict[str, Tuple[AggregatedNews, float]] = OrderedDict()
+        self._last_api_call: OrderedDict[str, float] = OrderedDict()
         self.min_call_interval = timedelta(seconds=10)  # Minimum 10 seconds between API calls
+        self._ttl = self.cache_duration.total_seconds()
+        self._min_interval = self.min_call_interval.total_seconds()
     
-    def should_fetch(self, key: str) -> bool:
+    def should_fetch(self, key: str, now: Optional[float] = None) -> bool:
         """Check if we should make a new API call."""
         if key not in self._last_api_call:
             return True
-        return datetime.now() - self._last_api_call[key] > self.min_call_interval
+        if now is None:
+            now = time.monotonic()
+        return now - self._last_api_call[key] > self._min_interval
+    
+    def get(self, key: str, now: Optional[float] = None) -> Optional[AggregatedNews]:
+        """Get cached aggregated news if still valid."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            news, timestamp = entry
+            if now is None:
+                now = time.monotonic()
+            if now - timestamp < self._ttl:
+                return news
+            del self._cache[key]
+        return None
     
-    def get(self, key: str) -> List[NewsArticle]:
-        """Get cached articles if still valid."""
-        if key in self._cache:
-            articles, timestamp = self._cache[key]
-            if datetime.now() - timestamp < self.cache_duration:
-                return articles
-        return []
+    def set(self, key: str, news: AggregatedNews, now: Optional[float] = None) -> None:
+        """Cache aggregated news with timestamp."""
+        if now is None:
+            now = time.monotonic()
+        self._cache[key] = (news, now)
+        self._cache.move_to_end(key)
+        self._last_api_call[key] = now
+        self._last_api_call.move_to_end(key)
+        self._evict(now)
     
-    def set(self, key: str, articles: List[NewsArticle]) -> None:
-        """Cache articles with timestamp."""
-        self._cache[key] = (articles, datetime.now())
-        self._last_api_call[key] = datetime.now()
+    def _evict(self, now: float) -> None:
+        """Drop expired entries and trim both maps to ``maxsize``."""
+        cache = self._cache
+        while cache:
+            _, timestamp = next(iter(cache.values()))
+            if len(cache) <= self.maxsize and now - timestamp < self._ttl:
+                break
+            cache.popitem(last=False)
+        
+        calls = self._last_api_call
+        while calls:
+            if len(calls) <= self.maxsize and now - next(iter(calls.values())) <= self._min_interval:
+                break
+            calls.popitem(last=False)
     
     def clear(self) -> None:
         """Clear all cached data."""
@@ -61,12 +109,24 @@ class NewsAggregator:
     
     def __init__(self):
         self.cache = NewsCache(DEFAULT_CONFIG.news.cache_duration_minutes)
-        self.executor = ThreadPoolExecutor(max_workers=DEFAULT_CONFIG.news.concurrent_workers)
+        # Every category an API or RSS source can serve; run.py validates the
+        # command line against the same set
+        self.categories: FrozenSet[str] = frozenset(NEWS_CATEGORIES).union(
+            rss_manager.get_all_categories()
+        )
+        # One API task and one RSS task per category, sized by sources rather
+        # than CPUs; threads are started lazily, so the headroom costs nothing
+        self.executor = ThreadPoolExecutor(
+            max_workers=min(_MAX_FETCH_WORKERS, 2 * len(self.categories))
+        )
         self._last_update = datetime.min
         self._current_articles: List[NewsArticle] = []
+        self._current_batch = NewsArticleBatch.from_articles([])
+        self._source_counts: Counter = Counter()
+        # (cache key, set of source articles, result) of the last full rebuild
+        self._last_build: Optional[Tuple[str, FrozenSet[NewsArticle], AggregatedNews]] = None
         
-        # Configure logging
-        logging.basicConfig(level=logging.INFO)
+        # Logging is configured by the entry points
         self.logger = logging.getLogger(__name__)
     
     def _fetch_api_news(self, category: str = 'general') -> List[NewsArticle]:
@@ -81,7 +141,7 @@ class NewsAggregator:
             api_keys=api_keys
         ))
         
-        self.logger.debug(f"Fetched {len(articles)} articles from API sources")
+        self.logger.debug("Fetched %d articles from API sources", len(articles))
         return articles
     
     def _fetch_rss_news(self, category: str = 'general') -> List[NewsArticle]:
@@ -95,53 +155,60 @@ class NewsAggregator:
                 category, DEFAULT_CONFIG.news.max_articles_per_source
             ))
         
-        self.logger.debug(f"Fetched {len(articles)} articles from RSS sources")
+        self.logger.debug("Fetched %d articles from RSS sources", len(articles))
         return articles
     
-    def _deduplicate_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
-        """Remove duplicate articles based on title similarity."""
-        seen_titles = set()
-        unique_articles = []
+    def _deduplicate_articles(self, articles: Iterable[NewsArticle],
+                              limit: Optional[int] = None) -> Tuple[List[NewsArticle], Set[str], Set[str]]:
+        """Remove duplicate articles based on title similarity.
+        
+        Returns the unique articles (at most ``limit``) together with their
+        sources and categories, collected in the same pass.
+        """
+        seen_titles: Set[int] = set()  # 64-bit fingerprints of normalized titles
+        sources: Set[str] = set()
+        categories: Set[str] = set()
+        unique_articles: List[NewsArticle] = []
+        
+        seen_add = seen_titles.add
+        sources_add = sources.add
+        categories_add = categories.add
+        append = unique_articles.append
         
         for article in articles:
             # Simple deduplication by title (could be enhanced with fuzzy matching)
-            title_key = article.title.lower().strip()
-            if title_key not in seen_titles and len(title_key) > 10:
-                seen_titles.add(title_key)
-                unique_articles.append(article)
+            title_key = article.title_lower.strip()
+            if len(title_key) <= 10:
+                continue
+            fingerprint = hash(title_key)
+            if fingerprint not in seen_titles:
+                seen_add(fingerprint)
+                sources_add(article.source)
+                categories_add(article.category)
+                append(article)
+                if limit is not None and len(unique_articles) >= limit:
+                    break
         
-        return unique_articles
+        return unique_articles, sources, categories
     
     def fetch_news_concurrent(self, categories: List[str] | None = None) -> AggregatedNews:
         """Fetch news from all sources concurrently with intelligent caching."""
         if categories is None:
             categories = ['general', 'technology', 'business']
+        else:
+            # Known categories only, once each
+            known = self.categories
+            categories = [category for category in dict.fromkeys(categories) if category in known]
         
-        # Check cache first and whether we should fetch new data
-        cache_key = f"news_{'-'.join(sorted(categories))}"
-        cached_articles = self.cache.get(cache_key)
-        
-        # If we have cached data and shouldn't fetch yet, return cached data
-        if cached_articles and not self.cache.should_fetch(cache_key):
-            self.logger.debug("Returning cached news (rate limited)")
-            return AggregatedNews(
-                articles=cached_articles,
-                last_updated=self._last_update,
-                total_sources=len(set(article.source for article in cached_articles)),
-                categories=set(article.category for article in cached_articles)
-            )
-        
-        # If cache is fresh enough, use it
-        if cached_articles:
+        # Check cache first; the cached entry is the fully built response
+        cache_key = _cache_key(tuple(sorted(categories)))
+        now = time.monotonic()
+        cached_news = self.cache.get(cache_key, now)
+        if cached_news is not None and cached_news.articles:
             self.logger.debug("Returning cached news")
-            return AggregatedNews(
-                articles=cached_articles,
-                last_updated=self._last_update,
-                total_sources=len(set(article.source for article in cached_articles)),
-                categories=set(article.category for article in cached_articles)
-            )
+            return cached_news
         
-        all_articles = []
+        runs: List[List[NewsArticle]] = []  # One article list per finished fetch
         sources_count = 0
         
         # Submit concurrent tasks for each category and source type
@@ -157,60 +224,71 @@ class NewsAggregator:
                 self.executor.submit(self._fetch_rss_news, category)
             )
         
-        # Collect results as they complete
-        for future in as_completed(futures, timeout=DEFAULT_CONFIG.api.timeout_seconds * 2):
+        # Wait once for the whole batch instead of once per future
+        done, not_done = wait(
+            futures, timeout=DEFAULT_CONFIG.api.timeout_seconds * 2, return_when=ALL_COMPLETED
+        )
+        for future in done:
             try:
-                articles = future.result(timeout=5)
-                all_articles.extend(articles)
+                runs.append(future.result())
                 sources_count += 1
             except Exception as e:
-                self.logger.error(f"Failed to fetch from source: {e}")
+                self.logger.error("Failed to fetch from source: %s", e)
                 continue
+        if not_done:
+            self.logger.warning("%d source fetches timed out", len(not_done))
         
-        # Remove duplicates and sort
-        unique_articles = self._deduplicate_articles(all_articles)
-        unique_articles.sort(key=lambda x: x.published_at, reverse=True)
+        # Feeds answering 304 hand back the same cached article objects, so an
+        # equal article set means nothing upstream moved. Hashes are precomputed
+        # and a hit compares the cached objects themselves, so this stays cheap
+        fingerprint = frozenset(article for run in runs for article in run)
+        last_build = self._last_build
+        if last_build is not None and last_build[0] == cache_key and last_build[1] == fingerprint:
+            self.logger.debug("Sources unchanged, reusing previous aggregation")
+            self.cache.set(cache_key, last_build[2], now)
+            return last_build[2]
         
-        # Limit total articles
-        final_articles = unique_articles[:DEFAULT_CONFIG.terminal.max_articles_display]
+        # Each run is small (API runs arrive already merged newest-first); sorting
+        # them lets a lazy merge feed the dedup, which stops at the display limit
+        # so the tail of the merge is never ordered at all
+        for run in runs:
+            run.sort(key=_PUBLISHED_AT, reverse=True)
+        newest_first = heapq.merge(*runs, key=_PUBLISHED_AT, reverse=True)
+        final_articles, sources, article_categories = self._deduplicate_articles(
+            newest_first, limit=DEFAULT_CONFIG.terminal.max_articles_display
+        )
         
-        # Cache results
-        self.cache.set(cache_key, final_articles)
         self._last_update = datetime.now()
         self._current_articles = final_articles
+        self._current_batch = NewsArticleBatch.from_articles(final_articles)
+        self._source_counts = Counter(self._current_batch.sources)
         
-        self.logger.debug(f"Aggregated {len(final_articles)} unique articles from {sources_count} sources")
-        
-        return AggregatedNews(
+        aggregated_news = AggregatedNews(
             articles=final_articles,
             last_updated=self._last_update,
-            total_sources=len(set(article.source for article in final_articles)),
-            categories=set(article.category for article in final_articles)
+            total_sources=len(sources),
+            categories=article_categories
         )
+        
+        # Cache results
+        self.cache.set(cache_key, aggregated_news, now)
+        self._last_build = (cache_key, fingerprint, aggregated_news)
+        
+        self.logger.debug("Aggregated %d unique articles from %d sources", len(final_articles), sources_count)
+        
+        return aggregated_news
     
     def get_articles_by_category(self, category: str) -> List[NewsArticle]:
         """Get current articles filtered by category."""
-        return [
-            article for article in self._current_articles
-            if article.category.lower() == category.lower()
-        ]
+        return self._current_batch.in_category(category)
     
     def search_articles(self, query: str) -> List[NewsArticle]:
         """Search current articles by query."""
-        query_lower = query.lower()
-        return [
-            article for article in self._current_articles
-            if query_lower in article.title.lower() or 
-               query_lower in article.description.lower()
-        ]
+        return self._current_batch.search(query)
     
     def get_top_sources(self, limit: int = 10) -> List[Tuple[str, int]]:
         """Get top news sources by article count."""
-        source_counts: Dict[str, int] = defaultdict(int)
-        for article in self._current_articles:
-            source_counts[article.source] += 1
-        
-        return sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return self._source_counts.most_common(limit)
     
     def refresh_cache(self) -> None:
         """Force refresh the news cache."""
@@ -1,10 +1,14 @@
 """
 Terminal display system for the news terminal - Enhanced for stock trading.
 """
-import os
+import queue
+import re
+import signal
+import sys
+import threading
 import time
 from datetime import datetime, timezone
-from typing import List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
 import shutil
 
 from rich.console import Console
@@ -14,6 +18,7 @@ from rich.text import Text
 from rich.layout import Layout
 from rich.live import Live
 from rich.align import Align
+from rich.cells import cell_len
 from colorama import init, Fore, Style
 
 from config import DEFAULT_CONFIG
@@ -23,10 +28,115 @@ from src.aggregator import AggregatedNews
 # Initialize colorama for cross-platform color support
 init(autoreset=True)
 
+# Lines the live layout spends outside table rows: header and status panels,
+# body panel borders, and the table's own borders and header row
+_LAYOUT_CHROME_LINES = 12
+
+# Rich table styles per (lowercase) category
+_CATEGORY_COLORS = {
+    'business': 'green',
+    'technology': 'bright_blue',
+    'general': 'white',
+    'politics': 'red',
+    'science': 'bright_cyan',
+    'sports': 'bright_green',
+    'entertainment': 'bright_magenta'
+}
+
+# Simple display styling, built once instead of per row
+_RESET = Style.RESET_ALL
+_ANSI_CATEGORY_COLORS = {'technology': Fore.YELLOW, 'business': Fore.GREEN}
+_URGENT_PREFIX = f"{Fore.RED}⚡ "
+# Line ending that also erases what a longer previous frame left on the line
+_EOL = "\033[K\n"
+_URGENT_KEYWORDS = frozenset(['earnings', 'merger', 'acquisition', 'fda', 'guidance', 'halt'])
+
+
+def clear_terminal() -> None:
+    """Clear the terminal with an ANSI escape instead of spawning clear/cls."""
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
+
+
+def _compile_keywords(keywords: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compile keywords into a single alternation matched against lowercased text."""
+    # Longest first so multi-word phrases win over their prefixes
+    ordered = sorted({keyword.lower() for keyword in keywords}, key=len, reverse=True)
+    if not ordered:
+        return None
+    return re.compile('|'.join(map(re.escape, ordered)))
+
+
+# Simple display urgency check, run against NewsArticle.title_lower
+_URGENT_RE = _compile_keywords(_URGENT_KEYWORDS)
+
+# SGR for the header clock ("bold yellow") and the status bar's age label ("yellow")
+_CLOCK_SGR = "\033[1;33m"
+_LABEL_SGR = "\033[33m"
+
+
+class _ClockCursorWriter:
+    """Rewrites the header clock and the "Updated ... ago" label in place.
+    
+    After a refresh Rich's Live leaves the cursor at the end of the layout's
+    last line, so both cells sit a fixed distance from it until the next
+    render. Armed for one screen state; any other state needs a Rich render.
+    """
+    __slots__ = ('_key', '_clock_up', '_clock_col', '_label_col', '_label_room', '_label_width')
+    
+    def __init__(self):
+        self._key = None
+        self._clock_up = 0
+        self._clock_col = 0
+        self._label_col: Optional[int] = None
+        self._label_room = 0
+        self._label_width = 0
+    
+    def arm(self, key, clock_up: int, clock_col: int,
+            label_at: Optional[Tuple[int, int]], label: str) -> None:
+        """Remember where the clock and label are for the screen state ``key``."""
+        self._key = key
+        self._clock_up = clock_up
+        self._clock_col = clock_col
+        self._label_col, self._label_room = label_at if label_at is not None else (None, 0)
+        self._label_width = len(label)
+    
+    def disarm(self) -> None:
+        """Forget the cell positions until the next arm()."""
+        self._key = None
+    
+    def write(self, file, key, clock: str, label: str) -> bool:
+        """Overwrite the clock and label if ``key`` matches the armed state."""
+        if self._key is None or key != self._key:
+            return False
+        label_col = self._label_col
+        if bool(label) != (label_col is not None) or len(label) > self._label_room:
+            return False
+        
+        # Save cursor, jump to the clock cell, write, restore for Live
+        out = f"\0337\033[{self._clock_up}A\r\033[{self._clock_col}C{_CLOCK_SGR}{clock}\033[0m\0338"
+        if label_col is not None:
+            # The label sits on the status bar's text row, one above the last
+            # line; blank the tail of a longer label ("59s" -> "1m")
+            pad = " " * (self._label_width - len(label))
+            self._label_width = max(self._label_width, len(label))
+            out += f"\0337\033[1A\r\033[{label_col}C{_LABEL_SGR}{label}\033[0m{pad}\0338"
+        file.write(out)
+        file.flush()
+        return True
+
 
 class TerminalDisplay:
     """Manages the terminal display for news - Enhanced for stock trading."""
     
+    __slots__ = (
+        'console', 'terminal_width', 'terminal_height', 'current_articles', 'last_update',
+        'new_articles_count', 'trading_keywords', '_keyword_matches', '_urgent_cache',
+        '_urgent_count', '_urgent_count_source', 'last_clock_update',
+        '_layout', '_cached_news', '_last_fp', '_row_cache', '_row_cache_key', '_resized',
+        '_last_strftime_sec', '_last_strftime_str', '_header_clock_col', '_status_label_at'
+    )
+    
     def __init__(self):
         self.console = Console()
         terminal_size = shutil.get_terminal_size()
@@ -36,11 +146,46 @@ class TerminalDisplay:
         self.last_update: Optional[datetime] = None
         self.new_articles_count = 0
         self.trading_keywords = DEFAULT_CONFIG.news.trading_keywords or []
+        # Trading-keyword matcher precompiled once on the shared NewsConfig
+        self._keyword_matches = DEFAULT_CONFIG.news.matches
+        # Urgency per article for the current content; keyed by the article
+        # itself (hash is precomputed) so recycled ids can never alias
+        self._urgent_cache: Dict[NewsArticle, bool] = {}
+        # Urgent total for the article list it was counted over
+        self._urgent_count = 0
+        self._urgent_count_source: Optional[List[NewsArticle]] = None
         self.last_clock_update = ""  # Track last clock update to prevent unnecessary refreshes
+        self._layout: Optional[Layout] = None  # Layout currently shown by Live
+        self._cached_news: Optional[AggregatedNews] = None  # Aggregation behind current_articles
+        self._last_fp = 0  # Fingerprint of current_articles' titles
+        # Formatted table rows, valid for one article list at one terminal width
+        self._row_cache: List[Tuple[str, str, Text, str, Text]] = []
+        self._row_cache_key: Tuple[Optional[List[NewsArticle]], int, int] = (None, 0, 0)
+        self._resized = False
+        # Clock strings for the last formatted second
+        self._last_strftime_sec: Optional[datetime] = None
+        self._last_strftime_str: Tuple[str, str] = ("", "")
+        # Column of the clock within the last header panel, None if it wraps
+        self._header_clock_col: Optional[int] = None
+        # (column, room) of the age label in the last status bar, None if absent or wrapped
+        self._status_label_at: Optional[Tuple[int, int]] = None
         
-    def _is_market_hours(self) -> tuple[bool, str]:
+    def _on_resize(self, signum=None, frame=None) -> None:
+        """Re-read the terminal size (SIGWINCH handler)."""
+        terminal_size = shutil.get_terminal_size()
+        self.terminal_width = terminal_size.columns
+        self.terminal_height = terminal_size.lines
+        self._resized = True
+    
+    def _visible_rows(self) -> int:
+        """Number of table rows that fit on screen."""
+        return min(DEFAULT_CONFIG.terminal.max_articles_display,
+                   max(1, self.terminal_height - _LAYOUT_CHROME_LINES))
+    
+    def _is_market_hours(self, now: Optional[datetime] = None) -> tuple[bool, str]:
         """Check if markets are open (US market hours: 9:30 AM - 4:00 PM ET)."""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         # Simplified - in reality you'd handle timezones properly
         current_hour = now.hour
         current_minute = now.minute
@@ -60,33 +205,66 @@ class TerminalDisplay:
         else:
             return False, "🔴 WEEKEND"
     
+    def _clock_strings(self, now: datetime) -> Tuple[str, str]:
+        """Format (date, clock) for ``now``, reusing the result within a second."""
+        second = now.replace(microsecond=0)
+        if second != self._last_strftime_sec:
+            self._last_strftime_sec = second
+            self._last_strftime_str = (
+                now.strftime("%Y-%m-%d"),
+                now.strftime(DEFAULT_CONFIG.terminal.clock_format)
+            )
+        return self._last_strftime_str
+    
     def _is_urgent_news(self, article: NewsArticle) -> bool:
         """Check if news article contains urgent trading keywords."""
-        title_lower = article.title.lower()
-        desc_lower = (article.description or "").lower()
+        cached = self._urgent_cache.get(article)
+        if cached is not None:
+            return cached
         
-        return any(
-            keyword in title_lower or keyword in desc_lower
-            for keyword in self.trading_keywords
-        )
+        # Title and description were lowercased together when the article was built
+        is_urgent = bool(self._keyword_matches(article.search_text))
+        self._urgent_cache[article] = is_urgent
+        return is_urgent
+    
+    @staticmethod
+    def _fingerprint(articles: List[NewsArticle]) -> int:
+        """Hash the ordered titles of an article list for cheap change detection."""
+        return hash(tuple(article.title for article in articles))
+    
+    def _count_urgent(self, articles: List[NewsArticle]) -> int:
+        """Count articles with urgent trading keywords, once per article list."""
+        if articles is not self._urgent_count_source:
+            is_urgent = self._is_urgent_news
+            self._urgent_count = sum(1 for article in articles if is_urgent(article))
+            # Holding the list keeps the identity check sound
+            self._urgent_count_source = articles
+        return self._urgent_count
         
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        clear_terminal()
     
-    def create_header(self) -> Panel:
+    def create_header(self, now: Optional[datetime] = None) -> Panel:
         """Create the header panel with title, market status, and current time with seconds."""
-        current_time = datetime.now().strftime(DEFAULT_CONFIG.terminal.clock_format)
-        current_date = datetime.now().strftime("%Y-%m-%d")
+        if now is None:
+            now = datetime.now()
+        current_date, current_time = self._clock_strings(now)
         
         # Get market status
-        is_open, market_status = self._is_market_hours()
+        is_open, market_status = self._is_market_hours(now)
+        
+        prefix = f"📰 NEWS TERMINAL | {current_date} ⏰ "
+        header_text = Text.assemble(
+            ("📰 NEWS TERMINAL ", "bold cyan"),
+            (f"| {current_date} ", "white"),
+            (f"⏰ {current_time} ", "bold yellow"),
+            (f"| {market_status}", "bold green" if is_open else "bold red"),
+        )
         
-        header_text = Text()
-        header_text.append("📰 NEWS TERMINAL ", style="bold cyan")
-        header_text.append(f"| {current_date} ", style="white")
-        header_text.append(f"⏰ {current_time} ", style="bold yellow")
-        header_text.append(f"| {market_status}", style="bold green" if is_open else "bold red")
+        # Locate the clock as Align.center will place it inside border and padding
+        spare = self.console.width - 4 - header_text.cell_len
+        self._header_clock_col = 2 + spare // 2 + cell_len(prefix) if spare >= 0 else None
         
         return Panel(
             Align.center(header_text),
@@ -97,31 +275,32 @@ class TerminalDisplay:
             border_style="bright_blue"  # Consistent border
         )
     
-    def create_status_bar(self, aggregated_news: AggregatedNews) -> Panel:
+    def create_status_bar(self, aggregated_news: AggregatedNews,
+                          urgent_count: Optional[int] = None,
+                          now: Optional[datetime] = None) -> Panel:
         """Create status bar with statistics and trading indicators."""
+        self._status_label_at = None
         if not aggregated_news.articles:
             status_text = Text("⚠️  No news articles loaded", style="bold red")
         else:
-            # Count urgent news
-            urgent_count = sum(1 for article in aggregated_news.articles if self._is_urgent_news(article))
-            
-            status_text = Text()
-            status_text.append(f"📊 {len(aggregated_news.articles)} articles ", style="green")
-            status_text.append(f"from {aggregated_news.total_sources} sources ", style="cyan")
-            
-            if urgent_count > 0:
-                status_text.append(f"| ⚡ {urgent_count} URGENT ", style="bold red blink")
+            if urgent_count is None:
+                urgent_count = self._count_urgent(aggregated_news.articles)
             
-            status_text.append(f"| Categories: {', '.join(sorted(aggregated_news.categories))} ", style="magenta")
+            # Empty parts are skipped by Text.assemble
+            label = self._updated_label(aggregated_news, now)
+            status_text = Text.assemble(
+                (f"📊 {len(aggregated_news.articles)} articles ", "green"),
+                (f"from {aggregated_news.total_sources} sources ", "cyan"),
+                (f"| ⚡ {urgent_count} URGENT " if urgent_count > 0 else "", "bold red blink"),
+                (f"| Categories: {', '.join(sorted(aggregated_news.categories))} ", "magenta"),
+                (label, "yellow"),
+            )
             
-            if self.last_update:
-                time_diff = datetime.now() - aggregated_news.last_updated
-                seconds_ago = int(time_diff.total_seconds())
-                if seconds_ago < 60:
-                    status_text.append(f"| Updated {seconds_ago}s ago", style="yellow")
-                else:
-                    minutes_ago = int(seconds_ago / 60)
-                    status_text.append(f"| Updated {minutes_ago}m ago", style="yellow")
+            # Left-aligned after border and padding; only usable on a single line
+            inner_width = self.console.width - 4
+            if label and status_text.cell_len <= inner_width:
+                label_col = status_text.cell_len - len(label)
+                self._status_label_at = (2 + label_col, inner_width - label_col)
         
         return Panel(
             status_text,
@@ -129,6 +308,35 @@ class TerminalDisplay:
             height=3
         )
     
+    def _updated_label(self, aggregated_news: AggregatedNews,
+                       now: Optional[datetime] = None) -> str:
+        """Status bar text for how long ago the news was updated."""
+        if not self.last_update or not aggregated_news.articles:
+            return ""
+        time_diff = (now or datetime.now()) - aggregated_news.last_updated
+        seconds_ago = int(time_diff.total_seconds())
+        if seconds_ago < 60:
+            return f"| Updated {seconds_ago}s ago"
+        minutes_ago = int(seconds_ago / 60)
+        return f"| Updated {minutes_ago}m ago"
+    
+    def _clock_key(self, now: datetime):
+        """Everything on screen besides the clock and age label that a tick can change."""
+        current_date, current_time = self._clock_strings(now)
+        return (current_date, len(current_time), self._is_market_hours(now)[1], self.console.size)
+    
+    def _arm_clock(self, clock_writer: _ClockCursorWriter,
+                   aggregated_news: AggregatedNews, now: datetime) -> None:
+        """Arm direct clock writes for the layout Live just rendered."""
+        console = self.console
+        if (self._header_clock_col is None or not console.is_terminal
+                or console.legacy_windows):
+            clock_writer.disarm()
+            return
+        # The layout fills the screen; the clock is on the header's second row
+        clock_writer.arm(self._clock_key(now), console.height - 2, self._header_clock_col,
+                         self._status_label_at, self._updated_label(aggregated_news, now))
+    
     def create_news_table(self, articles: List[NewsArticle]) -> Table:
         """Create a table of news articles with trading highlights."""
         table = Table(show_header=True, header_style="bold blue")
@@ -138,7 +346,25 @@ class TerminalDisplay:
         table.add_column("🚨", style="red", width=3)  # Urgent indicator
         table.add_column("Title", style="white", width=self.terminal_width - 50)
         
-        for article in articles[:DEFAULT_CONFIG.terminal.max_articles_display]:
+        # Only build rows that fit on screen
+        visible = self._visible_rows()
+        cache_key = (articles, self.terminal_width, visible)
+        cached_articles, cached_width, cached_visible = self._row_cache_key
+        if (cached_articles is not articles or cached_width != self.terminal_width
+                or cached_visible != visible):
+            self._row_cache = self._build_rows(articles[:visible])
+            # Holding the list keeps the identity check sound
+            self._row_cache_key = cache_key
+        
+        for row in self._row_cache:
+            table.add_row(*row)
+        
+        return table
+    
+    def _build_rows(self, articles: List[NewsArticle]) -> List[Tuple[str, str, Text, str, Text]]:
+        """Format table rows once for a list of articles."""
+        rows = []
+        for article in articles:
             # Format time with seconds for precision
             time_str = article.published_at.strftime("%H:%M:%S")
             
@@ -158,30 +384,22 @@ class TerminalDisplay:
             # Highlight urgent news in red
             title_style = "bold red" if is_urgent else "white"
             
-            table.add_row(
+            rows.append((
                 time_str,
                 article.source[:14],  # Truncate source name
                 Text(article.category.upper(), style=category_style),
                 urgent_indicator,
                 Text(title, style=title_style)
-            )
+            ))
         
-        return table
+        return rows
     
     def _get_category_style(self, category: str) -> str:
         """Get color style for category."""
-        category_colors = {
-            'business': 'green',
-            'technology': 'bright_blue',
-            'general': 'white',
-            'politics': 'red',
-            'science': 'bright_cyan',
-            'sports': 'bright_green',
-            'entertainment': 'bright_magenta'
-        }
-        return category_colors.get(category.lower(), 'white')
-    
-    def create_layout(self, aggregated_news: AggregatedNews) -> Layout:
+        # NewsArticle lowercases its category on construction
+        return _CATEGORY_COLORS.get(category, 'white')
+    
+    def create_layout(self, aggregated_news: AggregatedNews, now: Optional[datetime] = None) -> Layout:
         """Create the main layout."""
         layout = Layout()
         
@@ -192,16 +410,19 @@ class TerminalDisplay:
             Layout(name="status", size=3),
         )
         
+        # Count urgent news once for both the status bar and the table title
+        urgent_count = self._count_urgent(aggregated_news.articles)
+        
         # Populate sections
-        layout["header"].update(self.create_header())
-        layout["status"].update(self.create_status_bar(aggregated_news))
+        if now is None:
+            now = datetime.now()
+        layout["header"].update(self.create_header(now))
+        layout["status"].update(self.create_status_bar(aggregated_news, urgent_count, now))
         
         # Body with news table
         if aggregated_news.articles:
             news_table = self.create_news_table(aggregated_news.articles)
             
-            # Count urgent news for title
-            urgent_count = sum(1 for article in aggregated_news.articles if self._is_urgent_news(article))
             title = "📈 Live Trading News Feed"
             if urgent_count > 0:
                 title += f" | ⚡ {urgent_count} URGENT"
@@ -248,62 +469,151 @@ class TerminalDisplay:
     
     def display_news_live(self, get_news_func) -> None:
         """Display news with seamless live updates optimized for trading."""
+        # Track terminal resizes while live; signals only work on the main thread
+        watching_resize = False
+        if hasattr(signal, 'SIGWINCH'):
+            try:
+                previous_handler = signal.signal(signal.SIGWINCH, self._on_resize)
+                watching_resize = True
+            except ValueError:
+                pass
+        self._on_resize()
+        
+        try:
+            self._display_news_live(get_news_func)
+        finally:
+            if watching_resize:
+                signal.signal(signal.SIGWINCH, previous_handler or signal.SIG_DFL)
+    
+    def _fetch_worker(self, get_news_func, fetch_interval: float,
+                      fetch_q: queue.Queue, stop: threading.Event) -> None:
+        """Fetch news every ``fetch_interval`` seconds until ``stop`` is set."""
+        while not stop.wait(fetch_interval):
+            try:
+                item = get_news_func()
+            except Exception as e:
+                # Handed over so the render loop shows it like an inline failure
+                item = e
+            
+            # Only the newest result matters; drop one the loop hasn't taken yet.
+            # The loop only ever removes items, so the put cannot block
+            try:
+                fetch_q.get_nowait()
+            except queue.Empty:
+                pass
+            fetch_q.put_nowait(item)
+    
+    def _display_news_live(self, get_news_func) -> None:
+        """Run the live display loop."""
+        stop_fetch = threading.Event()
         try:
             # Get initial data
             aggregated_news = get_news_func()
             self.current_articles = aggregated_news.articles
             self.last_update = aggregated_news.last_updated
+            self._cached_news = aggregated_news
+            self._last_fp = self._fingerprint(aggregated_news.articles)
+            self._urgent_cache.clear()
+            self._urgent_count_source = None
             
+            # Later fetches run on a worker so HTTP latency never stalls the clock
+            fetch_interval = DEFAULT_CONFIG.terminal.trading_news_fetch_interval
+            fetch_q: queue.Queue = queue.Queue(maxsize=1)
+            threading.Thread(
+                target=self._fetch_worker,
+                args=(get_news_func, fetch_interval, fetch_q, stop_fetch),
+                name='news-fetch',
+                daemon=True
+            ).start()
+            
+            self._layout = self.create_layout(aggregated_news)
             with Live(
-                self.create_layout(aggregated_news), 
+                self._layout, 
                 console=self.console, 
-                refresh_per_second=10,  # High refresh rate for real-time trading
+                refresh_per_second=2,  # Redraws are driven explicitly below
                 auto_refresh=False,  # Manual control for precise updates
                 transient=False,  # Don't clear on exit
                 vertical_overflow="visible"  # Prevent layout shifts
             ) as live:
+                # Config and clock functions are fixed for the session; bind them once
+                refresh_interval = DEFAULT_CONFIG.terminal.refresh_interval
+                now_fn = datetime.now
+                time_fn = time.time
+                fetched = None  # Result taken off fetch_q while waiting
+                clock_writer = _ClockCursorWriter()
+                clock_file = self.console.file
+                self._arm_clock(clock_writer, aggregated_news, now_fn())
+                
                 while True:
                     try:
-                        current_time_str = datetime.now().strftime(DEFAULT_CONFIG.terminal.clock_format)
+                        # One clock reading per tick, shared by every panel
+                        now = now_fn()
+                        current_time_str = self._clock_strings(now)[1]
                         clock_changed = current_time_str != self.last_clock_update
                         
-                        # REAL-TIME MODE: Fetch news much more frequently
+                        # REAL-TIME MODE: the worker fetches news much more frequently
                         content_changed = False
-                        fetch_interval = DEFAULT_CONFIG.terminal.trading_news_fetch_interval
                         
-                        if not hasattr(self, '_last_news_fetch') or (time.time() - self._last_news_fetch) > fetch_interval:
-                            new_aggregated_news = get_news_func()
-                            self._last_news_fetch = time.time()
+                        if fetched is not None:
+                            new_aggregated_news, fetched = fetched, None
+                            if isinstance(new_aggregated_news, Exception):
+                                raise new_aggregated_news
                             
-                            # Check for content changes
-                            if not self.current_articles or len(new_aggregated_news.articles) != len(self.current_articles):
-                                content_changed = True
+                            # Check for content changes; a cached aggregation hands back
+                            # the very same list, which needs no fingerprinting at all
+                            new_articles = new_aggregated_news.articles
+                            if new_articles is self.current_articles:
+                                new_fp = self._last_fp
                             else:
-                                new_titles = {article.title for article in new_aggregated_news.articles}
-                                old_titles = {article.title for article in self.current_articles}
-                                if new_titles != old_titles:
-                                    content_changed = True
+                                new_fp = self._fingerprint(new_articles)
+                            content_changed = not self.current_articles or new_fp != self._last_fp
                             
                             if content_changed:
                                 self.current_articles = new_aggregated_news.articles
                                 self.last_update = new_aggregated_news.last_updated
+                                self._cached_news = new_aggregated_news
+                                self._last_fp = new_fp
+                                self._urgent_cache.clear()
+                                self._urgent_count_source = None
                         else:
-                            # Use cached data for rapid clock updates
-                            new_aggregated_news = AggregatedNews(
-                                articles=self.current_articles,
-                                last_updated=self.last_update or datetime.now(),
-                                total_sources=len(set(article.source for article in self.current_articles)) if self.current_articles else 0,
-                                categories=set(article.category for article in self.current_articles) if self.current_articles else set()
-                            )
+                            # Reuse the aggregation behind the current articles for clock ticks
+                            new_aggregated_news = self._cached_news
                         
-                        # Update display for any changes (clock or content)
-                        if clock_changed or content_changed:
-                            layout = self.create_layout(new_aggregated_news)
-                            live.update(layout, refresh=True)
+                        if self._resized:
+                            self._resized = False
+                            self._layout = None
+                        
+                        # Rebuild everything only for new content; a clock tick just
+                        # patches the header and status panels of the cached layout
+                        if content_changed or self._layout is None:
+                            self._layout = self.create_layout(new_aggregated_news, now)
+                            live.update(self._layout, refresh=True)
+                            self._arm_clock(clock_writer, new_aggregated_news, now)
+                            self.last_clock_update = current_time_str
+                        elif clock_changed:
+                            # Only the clock and the age label moved: write them straight
+                            # to their cells; otherwise patch the header and status panels
+                            label = self._updated_label(new_aggregated_news, now)
+                            if not clock_writer.write(clock_file, self._clock_key(now),
+                                                      current_time_str, label):
+                                self._layout["header"].update(self.create_header(now))
+                                self._layout["status"].update(
+                                    self.create_status_bar(new_aggregated_news, now=now)
+                                )
+                                live.refresh()
+                                self._arm_clock(clock_writer, new_aggregated_news, now)
                             self.last_clock_update = current_time_str
                         
-                        # Ultra-fast sleep for real-time performance
-                        time.sleep(DEFAULT_CONFIG.terminal.refresh_interval)
+                        if refresh_interval < 1.0:
+                            # Nothing visible changes between clock seconds, so wake on
+                            # the next second boundary unless news arrives first
+                            timeout = max(0.01, 1.0 - (time_fn() % 1.0))
+                        else:
+                            timeout = refresh_interval
+                        try:
+                            fetched = fetch_q.get(timeout=timeout)
+                        except queue.Empty:
+                            pass
                         
                     except KeyboardInterrupt:
                         break
@@ -326,6 +636,8 @@ class TerminalDisplay:
                             Panel(Text("Press Ctrl+C to exit | Auto-retry in 3s", style="yellow"))
                         )
                         live.update(error_layout)
+                        self._layout = None  # Rebuild once we recover
+                        clock_writer.disarm()
                         time.sleep(3)  # Wait before retrying
                         
         except KeyboardInterrupt:
@@ -333,6 +645,8 @@ class TerminalDisplay:
             self.console.print("\n👋 Returning to topic selection...", style="bold yellow")
         except Exception as e:
             self.console.print(f"\n❌ Fatal Error: {str(e)}", style="bold red")
+        finally:
+            stop_fetch.set()
     
     def show_article_details(self, article: NewsArticle) -> None:
         """Show detailed view of an article."""
@@ -356,20 +670,33 @@ class TerminalDisplay:
 class SimpleTerminalDisplay:
     """Simplified terminal display for basic terminals."""
     
+    __slots__ = ('width', '_prev_line_count', '_body', '_body_source')
+    
     def __init__(self):
         self.width = shutil.get_terminal_size().columns
+        self._prev_line_count = 0  # Lines written by the previous frame
+        # Urgent count and formatted article lines for the list they came from
+        self._body: Tuple[int, str] = (0, "")
+        self._body_source: Optional[List[NewsArticle]] = None
     
     def clear_screen(self) -> None:
         """Clear screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        clear_terminal()
     
     def display_news_loop(self, get_news_func) -> None:
         """Display news in simple format with seamless updates."""
+        last_articles = None
+        last_second = None
         try:
             while True:
                 try:
                     aggregated_news = get_news_func()
-                    self.display_news(aggregated_news)
+                    # Redraw only for new content or when the header clock ticks over
+                    second = int(time.time())
+                    if aggregated_news.articles is not last_articles or second != last_second:
+                        self.display_news(aggregated_news)
+                        last_articles = aggregated_news.articles
+                        last_second = second
                     time.sleep(DEFAULT_CONFIG.terminal.refresh_interval)
                 except KeyboardInterrupt:
                     break
@@ -381,57 +708,87 @@ class SimpleTerminalDisplay:
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}👋 Returning to topic selection...{Style.RESET_ALL}")
     
+    def _format_articles(self, articles: List[NewsArticle]) -> Tuple[int, str]:
+        """Count urgent articles and format the article lines, once per article list."""
+        urgent_search = _URGENT_RE.search
+        urgent_count = sum(1 for article in articles if urgent_search(article.title_lower))
+        
+        # Articles with urgency indicators
+        out = []
+        append = out.append
+        time_open = f"{Fore.CYAN}["
+        time_close = f"]{_RESET} "
+        source_open = f"{_RESET} {Fore.MAGENTA}"
+        category_colors = _ANSI_CATEGORY_COLORS
+        for article in articles[:30]:  # Show more for trading
+            time_str = article.published_at.strftime("%H:%M:%S")  # Include seconds
+            category_color = category_colors.get(article.category, Fore.WHITE)
+            
+            # Check for urgent keywords
+            urgent_prefix = _URGENT_PREFIX if urgent_search(article.title_lower) else ""
+            
+            append(f"{time_open}{time_str}{time_close}{category_color}[{article.category.upper()}]"
+                   f"{source_open}{article.source}{_RESET}\n")
+            append(f"  {urgent_prefix}{article.title}{_RESET}\n")
+            append("\n")
+        
+        return urgent_count, "".join(out)
+    
     def display_news(self, aggregated_news: AggregatedNews) -> None:
         """Display news in simple format with trading enhancements."""
+        # The frame is assembled in memory and written in one call; lines end with
+        # an explicit reset because colorama's autoreset only fires per write
+        out = []
+        append = out.append
+        
         # Use \033[H to move cursor to top instead of clearing screen
-        print("\033[H", end="")  # Move cursor to top-left
+        append("\033[H")  # Move cursor to top-left
         
         # Header with precise time
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        print(f"{Fore.CYAN}{'='*self.width}")
-        print(f"{Fore.CYAN}📰 TRADING NEWS TERMINAL - {current_time}")
-        print(f"{Fore.CYAN}{'='*self.width}{Style.RESET_ALL}")
+        now = datetime.now()
+        current_time = now.strftime('%Y-%m-%d %H:%M:%S')
+        rule = f"{Fore.CYAN}{'='*self.width}{Style.RESET_ALL}\n"
+        append(rule)
+        append(f"{Fore.CYAN}📰 TRADING NEWS TERMINAL - {current_time}{Style.RESET_ALL}\n")
+        append(rule)
         
         # Market status
-        now = datetime.now()
         current_hour = now.hour
         is_market_hours = 9 <= current_hour < 16 and now.weekday() < 5
         market_status = f"{Fore.GREEN}🟢 MARKET OPEN" if is_market_hours else f"{Fore.RED}🔴 MARKET CLOSED"
         
+        articles = aggregated_news.articles
+        if articles is not self._body_source:
+            self._body = self._format_articles(articles)
+            # Holding the list keeps the identity check sound
+            self._body_source = articles
+        urgent_count, body = self._body
+        
         # Status with urgent count
-        if aggregated_news.articles:
-            urgent_count = sum(1 for article in aggregated_news.articles 
-                             if any(keyword in article.title.lower() 
-                                   for keyword in ['earnings', 'merger', 'acquisition', 'fda', 'guidance']))
-            
-            print(f"{Fore.GREEN}📊 {len(aggregated_news.articles)} articles from {aggregated_news.total_sources} sources")
-            print(f"{market_status}")
+        if articles:
+            append(f"{Fore.GREEN}📊 {len(aggregated_news.articles)} articles from {aggregated_news.total_sources} sources{Style.RESET_ALL}\n")
+            append(f"{market_status}{Style.RESET_ALL}\n")
             if urgent_count > 0:
-                print(f"{Fore.RED}⚡ {urgent_count} URGENT TRADING NEWS{Style.RESET_ALL}")
+                append(f"{Fore.RED}⚡ {urgent_count} URGENT TRADING NEWS{Style.RESET_ALL}\n")
         else:
-            print(f"{Fore.RED}⚠️  No articles loaded{Style.RESET_ALL}")
+            append(f"{Fore.RED}⚠️  No articles loaded{Style.RESET_ALL}\n")
         
-        print()
+        append("\n")
+        append(body)
         
-        # Articles with urgency indicators
-        for i, article in enumerate(aggregated_news.articles[:30], 1):  # Show more for trading
-            time_str = article.published_at.strftime("%H:%M:%S")  # Include seconds
-            category_color = Fore.YELLOW if article.category == 'technology' else Fore.GREEN if article.category == 'business' else Fore.WHITE
-            
-            # Check for urgent keywords
-            is_urgent = any(keyword in article.title.lower() 
-                          for keyword in ['earnings', 'merger', 'acquisition', 'fda', 'guidance', 'halt'])
-            
-            urgent_prefix = f"{Fore.RED}⚡ " if is_urgent else ""
-            
-            print(f"{Fore.CYAN}[{time_str}]{Style.RESET_ALL} {category_color}[{article.category.upper()}]{Style.RESET_ALL} {Fore.MAGENTA}{article.source}{Style.RESET_ALL}")
-            print(f"  {urgent_prefix}{article.title}{Style.RESET_ALL}")
-            print()
+        append(f"{Fore.YELLOW}Press Ctrl+C to return to menu... Refreshing every {DEFAULT_CONFIG.terminal.refresh_interval}s{Style.RESET_ALL}\n")
         
-        # Clear any remaining lines from previous display
-        print("\033[J", end="")  # Clear from cursor to end of screen
+        # Overwrite in place: erase each line's tail, and blank only the lines a
+        # longer previous frame left below instead of clearing the whole screen
+        frame = "".join(out)
+        line_count = frame.count("\n")
+        frame = frame.replace("\n", _EOL)
+        if self._prev_line_count > line_count:
+            frame += _EOL * (self._prev_line_count - line_count)
+        self._prev_line_count = line_count
         
-        print(f"{Fore.YELLOW}Press Ctrl+C to return to menu... Refreshing every {DEFAULT_CONFIG.terminal.refresh_interval}s{Style.RESET_ALL}")
+        sys.stdout.write(frame)
+        sys.stdout.flush()
 
 
 # Global display instance
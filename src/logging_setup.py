@@ -0,0 +1,42 @@
+"""
+Queue-based logging setup shared by the News Terminal entry points.
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Listener started by the first configure_logging call
+_log_listener: Optional[QueueListener] = None
+
+
+def configure_logging(filename: str, fmt: str, verbose: bool = False,
+                      datefmt: Optional[str] = None) -> None:
+    """Log to ``filename`` (and stderr when verbose) through a listener thread.
+
+    Only the first call configures anything; later calls return at once
+    rather than starting a second listener.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    level = logging.DEBUG if verbose else logging.WARNING
+    # Callers only format and enqueue; file and stream writes happen on the
+    # listener thread. Records arrive formatted, so the writers need no format
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        logging.FileHandler(filename),
+        logging.StreamHandler() if verbose else logging.NullHandler()
+    )
+    listener.start()
+    _log_listener = listener
+    atexit.register(listener.stop)  # Drains the queue on exit
+    logging.basicConfig(
+        level=level,
+        format=fmt,
+        datefmt=datefmt,
+        handlers=[QueueHandler(log_queue)]
+    )
@@ -1,7 +1,6 @@
 """
 Interactive menu system for topic selection.
 """
-import os
 from typing import Dict, List, Optional
 from rich.console import Console
 from rich.panel import Panel
@@ -10,6 +9,8 @@ from rich.text import Text
 from rich.align import Align
 from colorama import init, Fore, Style
 
+from src.display import clear_terminal
+
 # Initialize colorama
 init(autoreset=True)
 
@@ -29,21 +30,21 @@ class TopicMenu:
             '7': {'name': 'Science & Health', 'categories': ['science'], 'emoji': '🔬', 'desc': 'Scientific discoveries, medical news'},
             '8': {'name': 'All Categories', 'categories': ['financial', 'technology', 'business', 'general'], 'emoji': '🌍', 'desc': 'Comprehensive news coverage'},
         }
+        # The menu never changes, so its Rich renderables are built once
+        self._build_panels()
     
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        clear_terminal()
     
-    def show_menu(self) -> Optional[List[str]]:
-        """Display topic selection menu and return selected categories."""
-        self.clear_screen()
-        
+    def _build_panels(self) -> None:
+        """Build the static header, menu and footer panels."""
         # Create header
         header_text = Text()
         header_text.append("📰 NEWS TERMINAL ", style="bold cyan")
         header_text.append("- Topic Selection", style="white")
         
-        header_panel = Panel(
+        self._header_panel = Panel(
             Align.center(header_text),
             style="bright_blue",
             height=3
@@ -65,7 +66,7 @@ class TopicMenu:
         # Add exit option
         table.add_row("q", "❌ Exit", "Quit the application")
         
-        menu_panel = Panel(
+        self._menu_panel = Panel(
             table,
             title="📋 Select News Topic",
             style="bright_blue"
@@ -73,37 +74,40 @@ class TopicMenu:
         
         # Create footer
         footer_text = Text("Enter your choice (1-8, or 'q' to quit): ", style="bold yellow")
-        footer_panel = Panel(footer_text, style="bright_black")
-        
-        # Display menu
-        self.console.print(header_panel)
-        self.console.print()
-        self.console.print(menu_panel)
-        self.console.print()
-        self.console.print(footer_panel)
-        
-        # Get user input
-        try:
-            choice = input().strip().lower()
+        self._footer_panel = Panel(footer_text, style="bright_black")
+    
+    def show_menu(self) -> Optional[List[str]]:
+        """Display topic selection menu and return selected categories."""
+        while True:
+            self.clear_screen()
             
-            if choice == 'q':
-                return None
+            # Display menu
+            self.console.print(self._header_panel)
+            self.console.print()
+            self.console.print(self._menu_panel)
+            self.console.print()
+            self.console.print(self._footer_panel)
             
-            if choice in self.topics:
-                selected_topic = self.topics[choice]
-                self.show_loading(selected_topic['name'])
-                return selected_topic['categories']
-            else:
+            # Get user input
+            try:
+                choice = input().strip().lower()
+                
+                if choice == 'q':
+                    return None
+                
+                if choice in self.topics:
+                    selected_topic = self.topics[choice]
+                    self.show_loading(selected_topic['name'])
+                    return selected_topic['categories']
+                
                 self.console.print(f"\n❌ Invalid choice: {choice}. Please try again.", style="bold red")
                 input("Press Enter to continue...")
-                return self.show_menu()  # Recursive call to show menu again
                 
-        except KeyboardInterrupt:
-            return None
-        except Exception:
-            self.console.print("\n❌ Invalid input. Please try again.", style="bold red")
-            input("Press Enter to continue...")
-            return self.show_menu()
+            except (KeyboardInterrupt, EOFError):
+                return None
+            except Exception:
+                self.console.print("\n❌ Invalid input. Please try again.", style="bold red")
+                input("Press Enter to continue...")
     
     def show_loading(self, topic_name: str):
         """Show loading screen for selected topic."""
@@ -146,49 +150,48 @@ class SimpleTopicMenu:
     
     def clear_screen(self):
         """Clear screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        clear_terminal()
     
     def show_menu(self) -> Optional[List[str]]:
         """Display simple topic menu."""
-        self.clear_screen()
-        
-        print(f"{Fore.CYAN}{'='*70}")
-        print(f"{Fore.CYAN}📰 NEWS TERMINAL - Topic Selection")
-        print(f"{Fore.CYAN}{'='*70}{Style.RESET_ALL}")
-        print()
-        
-        print(f"{Fore.YELLOW}Please select a news topic:{Style.RESET_ALL}")
-        print()
-        
-        for key, topic in self.topics.items():
-            print(f"{Fore.CYAN}[{key}]{Style.RESET_ALL} {topic['name']}")
-        
-        print(f"{Fore.RED}[q]{Style.RESET_ALL} Exit")
-        print()
-        
-        try:
-            choice = input(f"{Fore.YELLOW}Enter your choice (1-8, or 'q' to quit): {Style.RESET_ALL}").strip().lower()
+        while True:
+            self.clear_screen()
             
-            if choice == 'q':
-                return None
+            print(f"{Fore.CYAN}{'='*70}")
+            print(f"{Fore.CYAN}📰 NEWS TERMINAL - Topic Selection")
+            print(f"{Fore.CYAN}{'='*70}{Style.RESET_ALL}")
+            print()
+            
+            print(f"{Fore.YELLOW}Please select a news topic:{Style.RESET_ALL}")
+            print()
+            
+            for key, topic in self.topics.items():
+                print(f"{Fore.CYAN}[{key}]{Style.RESET_ALL} {topic['name']}")
+            
+            print(f"{Fore.RED}[q]{Style.RESET_ALL} Exit")
+            print()
+            
+            try:
+                choice = input(f"{Fore.YELLOW}Enter your choice (1-8, or 'q' to quit): {Style.RESET_ALL}").strip().lower()
+                
+                if choice == 'q':
+                    return None
+                    
+                if choice in self.topics:
+                    selected_topic = self.topics[choice]
+                    print(f"\n{Fore.GREEN}🔄 Loading {selected_topic['name']} news...{Style.RESET_ALL}")
+                    import time
+                    time.sleep(1.5)
+                    return selected_topic['categories']
                 
-            if choice in self.topics:
-                selected_topic = self.topics[choice]
-                print(f"\n{Fore.GREEN}🔄 Loading {selected_topic['name']} news...{Style.RESET_ALL}")
-                import time
-                time.sleep(1.5)
-                return selected_topic['categories']
-            else:
                 print(f"\n{Fore.RED}❌ Invalid choice: {choice}. Please try again.{Style.RESET_ALL}")
                 input("Press Enter to continue...")
-                return self.show_menu()
-                
-        except KeyboardInterrupt:
-            return None
-        except Exception:
-            print(f"\n{Fore.RED}❌ Invalid input. Please try again.{Style.RESET_ALL}")
-            input("Press Enter to continue...")
-            return self.show_menu()
+                    
+            except (KeyboardInterrupt, EOFError):
+                return None
+            except Exception:
+                print(f"\n{Fore.RED}❌ Invalid input. Please try again.{Style.RESET_ALL}")
+                input("Press Enter to continue...")
 
 
 # Global menu instances
@@ -4,21 +4,22 @@ Uses async/await and streaming for sub-second news updates.
 """
 import asyncio
 import logging
-from collections import deque
+import os
+import random
+import re
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 import time
 from dataclasses import dataclass
-from threading import Lock, Thread
-import aiohttp
+from threading import Lock
 
 from config import DEFAULT_CONFIG
-from data.api import NewsArticle, fetch_all_news
+from data.api import _PUBLISHED_AT, NewsArticle, fetch_all_news
 from data.rss import rss_manager
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RealTimeNews:
     """Container for real-time news with streaming metadata."""
     articles: List[NewsArticle]
@@ -29,42 +30,139 @@ class RealTimeNews:
     breaking_news_count: int
 
 
+# Lock stripes in RealTimeCache; a power of two so the shard is a mask
+_CACHE_SHARDS = 16
+
+# Per-key TTL bounds (seconds), EWMA weight of the newest content-change
+# interval, and the +/- jitter fraction that keeps keys from expiring together
+_MIN_TTL = 5.0
+_MAX_TTL = 300.0
+_CADENCE_ALPHA = 0.3
+_TTL_JITTER = 0.1
+
+
+# Fetch threads shared by every aggregator, started on first use; the
+# NEWS_FETCH_THREADS environment variable overrides the size
+_fetch_pool: Optional[ThreadPoolExecutor] = None
+_fetch_pool_lock = Lock()
+
+
+def _get_fetch_pool() -> ThreadPoolExecutor:
+    """Return the shared real-time fetch pool, creating it if needed."""
+    global _fetch_pool
+    with _fetch_pool_lock:
+        if _fetch_pool is None:
+            default_workers = min(32, 4 * (os.cpu_count() or 1))
+            _fetch_pool = ThreadPoolExecutor(
+                max_workers=int(os.environ.get('NEWS_FETCH_THREADS', default_workers)),
+                thread_name_prefix='news-fetch'
+            )
+        return _fetch_pool
+
+
+# Breaking-news keywords and priority sources, lowercased
+_BREAKING_NEWS_KEYWORDS = frozenset({
+    'breaking', 'urgent', 'alert', 'flash', 'developing',
+    'halt', 'suspend', 'emergency', 'crash', 'surge'
+})
+_PRIORITY_SOURCES = frozenset({
+    'bloomberg', 'reuters', 'financial times', 'marketwatch',
+    'yahoo finance', 'cnbc', 'wall street journal'
+})
+
+# Each set as one alternation, so a check is a single C-level scan. Breaking
+# keywords must start a word ("asphalt" is not a halt) but may be inflected;
+# the breaking pattern runs on NewsArticle.search_text, already lowercased.
+_BREAKING_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, sorted(_BREAKING_NEWS_KEYWORDS))) + ')')
+_PRIORITY_RE = re.compile('|'.join(map(re.escape, sorted(_PRIORITY_SOURCES))), re.IGNORECASE)
+
+
 class RealTimeCache:
-    """Ultra-fast cache for real-time news with streaming updates."""
+    """Ultra-fast cache for real-time news with streaming updates.
+    
+    Keys are spread over lock stripes so callers working on different keys
+    never contend. Times are ``time.monotonic()`` seconds.
+    
+    Each key's TTL follows how often its content actually changes: an EWMA
+    of the intervals between sets that brought new titles, clamped to
+    [_MIN_TTL, _MAX_TTL], jittered, and scaling the minimum fetch interval.
+    """
     
     def __init__(self, cache_duration_seconds: int = 30):
-        self.cache_duration = timedelta(seconds=cache_duration_seconds)
-        self._cache: Dict[str, tuple] = {}
-        self._lock = Lock()
-        self._last_fetch_times: Dict[str, float] = {}
+        self.cache_duration = float(cache_duration_seconds)  # TTL before a key has history
+        self._locks = [Lock() for _ in range(_CACHE_SHARDS)]
+        # key -> (articles, stored at, ttl)
+        self._caches: List[Dict[str, Tuple[List[NewsArticle], float, float]]] = [
+            {} for _ in range(_CACHE_SHARDS)
+        ]
+        # key -> (last fetch, minimum interval before the next)
+        self._fetch_times: List[Dict[str, Tuple[float, float]]] = [{} for _ in range(_CACHE_SHARDS)]
+        # key -> (EWMA change interval, last change)
+        self._cadence: List[Dict[str, Tuple[float, float]]] = [{} for _ in range(_CACHE_SHARDS)]
         self.min_fetch_interval = 0.5  # 500ms minimum between fetches
     
+    @staticmethod
+    def _shard(key: str) -> int:
+        """Index of the stripe holding ``key``."""
+        return hash(key) & (_CACHE_SHARDS - 1)
+    
     def should_fetch(self, key: str) -> bool:
         """Check if we should make a new real-time fetch."""
-        with self._lock:
-            last_fetch = self._last_fetch_times.get(key, 0)
-            return (time.time() - last_fetch) >= self.min_fetch_interval
+        shard = self._shard(key)
+        with self._locks[shard]:
+            fetched = self._fetch_times[shard].get(key)
+        if fetched is None:
+            return True
+        last_fetch, min_interval = fetched
+        return (time.monotonic() - last_fetch) >= min_interval
     
     def get(self, key: str) -> Optional[List[NewsArticle]]:
         """Get cached articles if still valid."""
-        with self._lock:
-            if key in self._cache:
-                articles, timestamp = self._cache[key]
-                if datetime.now() - timestamp < self.cache_duration:
-                    return articles
+        shard = self._shard(key)
+        with self._locks[shard]:
+            entry = self._caches[shard].get(key)
+        if entry is not None:
+            articles, timestamp, ttl = entry
+            if time.monotonic() - timestamp < ttl:
+                return articles
         return None
     
     def set(self, key: str, articles: List[NewsArticle]) -> None:
-        """Cache articles with timestamp."""
-        with self._lock:
-            self._cache[key] = (articles, datetime.now())
-            self._last_fetch_times[key] = time.time()
+        """Cache articles with timestamp and a TTL from the key's update cadence."""
+        shard = self._shard(key)
+        now = time.monotonic()
+        with self._locks[shard]:
+            previous = self._caches[shard].get(key)
+            cadence = self._cadence[shard].get(key)
+        
+        if previous is None or cadence is None:
+            interval, last_change = self.cache_duration, now
+        else:
+            interval, last_change = cadence
+            previous_titles = {article.title_lower for article in previous[0]}
+            if any(article.title_lower not in previous_titles for article in articles):
+                interval += _CADENCE_ALPHA * ((now - last_change) - interval)
+                last_change = now
+        
+        # A long quiet stretch stretches the TTL even before the next change
+        base = min(max(interval, now - last_change, _MIN_TTL), _MAX_TTL)
+        ttl = base * random.uniform(1.0 - _TTL_JITTER, 1.0 + _TTL_JITTER)
+        min_interval = max(self.min_fetch_interval, ttl * self.min_fetch_interval / self.cache_duration)
+        
+        with self._locks[shard]:
+            self._caches[shard][key] = (articles, now, ttl)
+            self._fetch_times[shard][key] = (now, min_interval)
+            self._cadence[shard][key] = (interval, last_change)
     
     def clear(self) -> None:
         """Clear all cached data."""
-        with self._lock:
-            self._cache.clear()
-            self._last_fetch_times.clear()
+        for lock, cache, fetch_times, cadence in zip(
+            self._locks, self._caches, self._fetch_times, self._cadence
+        ):
+            with lock:
+                cache.clear()
+                fetch_times.clear()
+                cadence.clear()
 
 
 class RealTimeNewsAggregator:
@@ -73,76 +171,53 @@ class RealTimeNewsAggregator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.cache = RealTimeCache(cache_duration_seconds=30)
-        self.executor = ThreadPoolExecutor(max_workers=DEFAULT_CONFIG.news.concurrent_workers)
+        self.executor = _get_fetch_pool()
         self._last_update = datetime.now()
         self._update_count = 0
-        self._start_time = time.time()
-        self._breaking_news_keywords = [
-            'breaking', 'urgent', 'alert', 'flash', 'developing',
-            'halt', 'suspend', 'emergency', 'crash', 'surge'
-        ]
-        
-        # Real-time news queue for streaming updates
-        self._news_queue = deque(maxlen=1000)
-        self._queue_lock = Lock()
+        self._start_time = time.monotonic()
+        # Breaking-article count of each cached result, set alongside the cache
+        self._breaking_counts: Dict[str, int] = {}
+        self._stream_task: Optional[asyncio.Task] = None
         
-        # Priority sources for real-time updates
-        self._priority_sources = [
-            'Bloomberg', 'Reuters', 'Financial Times', 'MarketWatch',
-            'Yahoo Finance', 'CNBC', 'Wall Street Journal'
-        ]
+        # Latest streamed result; readers only want the newest, and rebinding
+        # one reference is atomic, so even readers on other threads need no lock
+        self._latest: Optional[RealTimeNews] = None
     
-    async def _fetch_async_news(self, session: aiohttp.ClientSession, category: str) -> List[NewsArticle]:
+    async def _fetch_async_news(self, categories: List[str]) -> List[NewsArticle]:
         """Async fetch for real-time performance."""
-        try:
-            # This would be enhanced with real WebSocket streams in production
-            # For now, we'll use rapid async HTTP polling
-            articles = await asyncio.get_event_loop().run_in_executor(
-                self.executor, self._fetch_sync_news, category
-            )
-            return articles
-        except Exception as e:
-            self.logger.error(f"Async fetch error for {category}: {e}")
-            return []
+        # This would be enhanced with real WebSocket streams in production
+        # For now, we'll use rapid async HTTP polling
+        loop = asyncio.get_running_loop()
+        # One API job per distinct category and a single RSS batch, so feeds
+        # shared between categories are only fetched once
+        jobs = [
+            loop.run_in_executor(self.executor, self._fetch_sync_news, category)
+            for category in dict.fromkeys(categories)
+        ]
+        jobs.append(loop.run_in_executor(self.executor, self._fetch_sync_rss_batch, categories))
+        
+        # Filter each job's articles as it lands rather than after the slowest
+        all_articles = []
+        for job in asyncio.as_completed(jobs):
+            try:
+                all_articles.extend(self._recent(await job))
+            except Exception as e:
+                self.logger.error("Async fetch error for %s: %s", categories, e)
+        return all_articles
     
     def _fetch_sync_news(self, category: str) -> List[NewsArticle]:
-        """Synchronous news fetch for executor."""
-        try:
-            # Combine API and RSS sources
-            api_articles = fetch_all_news([category])
-            rss_articles = rss_manager.fetch_category_news(category)
-            
-            all_articles = api_articles + rss_articles
-            
-            # Filter for real-time relevance
-            recent_articles = []
-            cutoff_time = datetime.now() - timedelta(hours=2)  # Only very recent news
-            
-            for article in all_articles:
-                if article.published_at > cutoff_time:
-                    recent_articles.append(article)
-            
-            return recent_articles
-        except Exception as e:
-            self.logger.error(f"Sync fetch error for {category}: {e}")
-            return []
+        """Synchronous API news fetch for executor."""
+        return list(fetch_all_news(category))
     
-    def _is_breaking_news(self, article: NewsArticle) -> bool:
-        """Identify breaking/urgent news for priority display."""
-        title_lower = article.title.lower()
-        desc_lower = (article.description or "").lower()
-        
-        return any(
-            keyword in title_lower or keyword in desc_lower
-            for keyword in self._breaking_news_keywords
-        )
+    def _fetch_sync_rss_batch(self, categories: List[str]) -> List[NewsArticle]:
+        """Synchronous RSS fetch for executor, covering every category at once."""
+        return list(rss_manager.fetch_categories_news(categories))
     
-    def _is_priority_source(self, article: NewsArticle) -> bool:
-        """Check if article is from a priority real-time source."""
-        return any(
-            priority_source.lower() in article.source.lower()
-            for priority_source in self._priority_sources
-        )
+    @staticmethod
+    def _recent(articles: List[NewsArticle]) -> List[NewsArticle]:
+        """Filter for real-time relevance."""
+        cutoff_time = datetime.now() - timedelta(hours=2)  # Only very recent news
+        return [article for article in articles if article.published_at > cutoff_time]
     
     async def fetch_real_time_news(self, categories: List[str]) -> RealTimeNews:
         """Fetch news with real-time streaming performance."""
@@ -153,123 +228,135 @@ class RealTimeNewsAggregator:
             cached_articles = self.cache.get(cache_key)
             if cached_articles:
                 self.logger.debug("Returning cached real-time news")
-                return self._create_realtime_response(cached_articles)
-        
-        # Async fetch from multiple sources concurrently
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._fetch_async_news(session, category)
-                for category in categories
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+                return self._create_realtime_response(
+                    cached_articles, self._breaking_counts.get(cache_key, 0)
+                )
         
-        # Combine and process results
-        all_articles = []
-        for result in results:
-            if isinstance(result, list):
-                all_articles.extend(result)
-            else:
-                self.logger.error(f"Async task failed: {result}")
+        # API and RSS jobs run concurrently on the shared fetch pool
+        all_articles = await self._fetch_async_news(categories)
         
         # Deduplicate and sort by priority
-        unique_articles = self._deduplicate_and_prioritize(all_articles)
+        unique_articles, breaking_count = self._deduplicate_and_prioritize(all_articles)
         
         # Cache the results
         self.cache.set(cache_key, unique_articles)
+        self._breaking_counts[cache_key] = breaking_count
         
         # Update metrics
         self._update_count += 1
         self._last_update = datetime.now()
         
-        return self._create_realtime_response(unique_articles)
+        return self._create_realtime_response(unique_articles, breaking_count)
     
-    def _deduplicate_and_prioritize(self, articles: List[NewsArticle]) -> List[NewsArticle]:
-        """Remove duplicates and sort by priority for real-time display."""
+    def _deduplicate_and_prioritize(self, articles: List[NewsArticle]) -> Tuple[List[NewsArticle], int]:
+        """Remove duplicates and sort by priority for real-time display.
+        
+        Returns the kept articles and how many of them are breaking news.
+        """
         seen_titles = set()
         prioritized_articles = []
         breaking_news = []
         priority_news = []
         regular_news = []
+        breaking_search = _BREAKING_RE.search
+        priority_search = _PRIORITY_RE.search
         
-        for article in articles:
-            title_key = article.title.lower().strip()
-            if title_key in seen_titles or len(title_key) < 10:
+        # Sort once by recency; each bucket then fills already in order
+        for article in sorted(articles, key=_PUBLISHED_AT, reverse=True):
+            title_key = article.title_lower.strip()
+            if len(title_key) < 10:
+                continue
+            fingerprint = hash(title_key)
+            if fingerprint in seen_titles:
                 continue
             
-            seen_titles.add(title_key)
+            seen_titles.add(fingerprint)
             
             # Categorize by priority
-            if self._is_breaking_news(article):
+            if breaking_search(article.search_text):
                 breaking_news.append(article)
-            elif self._is_priority_source(article):
+            elif priority_search(article.source):
                 priority_news.append(article)
             else:
                 regular_news.append(article)
         
-        # Sort each category by recency
-        breaking_news.sort(key=lambda x: x.published_at, reverse=True)
-        priority_news.sort(key=lambda x: x.published_at, reverse=True)
-        regular_news.sort(key=lambda x: x.published_at, reverse=True)
-        
         # Combine in priority order
         prioritized_articles = breaking_news + priority_news + regular_news
         
-        return prioritized_articles[:DEFAULT_CONFIG.terminal.max_articles_display]
+        # Breaking articles lead the list, so the cut keeps all or a prefix of them
+        max_articles = DEFAULT_CONFIG.terminal.max_articles_display
+        return prioritized_articles[:max_articles], min(len(breaking_news), max_articles)
     
-    def _create_realtime_response(self, articles: List[NewsArticle]) -> RealTimeNews:
+    def _create_realtime_response(self, articles: List[NewsArticle], breaking_count: int) -> RealTimeNews:
         """Create real-time news response with metrics."""
-        elapsed_time = time.time() - self._start_time
+        elapsed_time = time.monotonic() - self._start_time
         update_frequency = self._update_count / elapsed_time if elapsed_time > 0 else 0
         
-        breaking_count = sum(1 for article in articles if self._is_breaking_news(article))
+        # Sources and categories in one pass over the articles
+        sources = set()
+        categories = set()
+        sources_add = sources.add
+        categories_add = categories.add
+        for article in articles:
+            sources_add(article.source)
+            categories_add(article.category)
         
         return RealTimeNews(
             articles=articles,
             last_updated=self._last_update,
-            total_sources=len(set(article.source for article in articles)),
-            categories=set(article.category for article in articles),
+            total_sources=len(sources),
+            categories=categories,
             update_frequency=update_frequency,
             breaking_news_count=breaking_count
         )
     
-    def start_streaming(self, categories: List[str], callback=None):
-        """Start continuous real-time news streaming in background thread."""
-        def stream_worker():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            while True:
-                try:
-                    news = loop.run_until_complete(
-                        self.fetch_real_time_news(categories)
-                    )
-                    
-                    if callback:
-                        callback(news)
-                    
-                    # Add to queue for main thread consumption
-                    with self._queue_lock:
-                        self._news_queue.append(news)
-                    
-                    # Sleep for real-time interval
-                    time.sleep(DEFAULT_CONFIG.terminal.trading_news_fetch_interval)
-                    
-                except Exception as e:
-                    self.logger.error(f"Streaming error: {e}")
-                    time.sleep(1.0)  # Brief pause on error
-        
-        # Start streaming in background thread
-        stream_thread = Thread(target=stream_worker, daemon=True)
-        stream_thread.start()
-        return stream_thread
+    def start_streaming(self, categories: List[str], callback=None) -> asyncio.Task:
+        """Start continuous real-time news streaming as a task on the running loop."""
+        if self._stream_task is None or self._stream_task.done():
+            self._stream_task = asyncio.get_running_loop().create_task(
+                self._stream_loop(categories, callback)
+            )
+        return self._stream_task
+    
+    async def _stream_loop(self, categories: List[str], callback=None) -> None:
+        """Fetch and publish news until cancelled."""
+        interval = DEFAULT_CONFIG.terminal.trading_news_fetch_interval
+        clock = asyncio.get_running_loop().time
+        while True:
+            # Ticks are scheduled from when each fetch started, so fetch time
+            # doesn't stretch the interval
+            deadline = clock() + interval
+            try:
+                news = await self.fetch_real_time_news(categories)
+                
+                if callback:
+                    callback(news)
+                
+                # Publish for consumers polling get_latest_from_queue
+                self._latest = news
+                
+                # Sleep until the next tick is due
+                await asyncio.sleep(max(0.0, deadline - clock()))
+                
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error("Streaming error: %s", e)
+                await asyncio.sleep(1.0)  # Brief pause on error
+    
+    async def stop_streaming(self) -> None:
+        """Cancel the streaming task and wait for it to finish."""
+        task, self._stream_task = self._stream_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
     
     def get_latest_from_queue(self) -> Optional[RealTimeNews]:
-        """Get the latest news from the streaming queue."""
-        with self._queue_lock:
-            if self._news_queue:
-                return self._news_queue[-1]  # Get most recent
-        return None
+        """Get the latest news published by the streaming task."""
+        return self._latest
 
 
 # Global real-time aggregator instance